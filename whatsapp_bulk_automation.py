@@ -30,6 +30,8 @@ Prerequisites:
 
 Installation:
     pip install selenium pandas webdriver-manager openpyxl schedule
+    pip install aiohttp              # Optional: WhatsApp Business Cloud API backend
+    pip install phonenumbers         # Optional: phone number validation (E.164)
 
 Usage:
     python whatsapp_bulk_automation.py
@@ -43,20 +45,39 @@ Important Notes:
 ==============================================================================
 """
 
+from __future__ import annotations
+
 # Standard library imports
+import asyncio
 import time
 import os
-import csv
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
 import logging
+import queue
 import random
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
-
-# Third-party imports
-import pandas as pd
+import re
+import sqlite3
+import string
+import sys
+import threading
+import types
+import urllib.parse
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Third-party imports (pandas is imported on first use, see _get_pandas)
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
@@ -64,11 +85,97 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
+    StaleElementReferenceException,
     WebDriverException,
     ElementClickInterceptedException
 )
 from webdriver_manager.chrome import ChromeDriverManager
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pandas():
+    """
+    Import pandas on first use.
+
+    pandas takes a few hundred milliseconds to import, which the scheduler
+    and the browser setup should not pay before any file is read.
+
+    Returns:
+        module: The ``pandas`` module
+    """
+    import pandas
+    return pandas
+
+
+# Optional: pyarrow gives pandas a multithreaded CSV parser (probed without importing it)
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+# Optional: python-calamine is a much faster Excel reader than openpyxl
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') is not None else None
+
+# Optional: phonenumbers validates contacts and normalizes them to E.164
+try:
+    import phonenumbers
+except ImportError:
+    phonenumbers = None
+
+# Contacts made only of digits and phone punctuation are treated as phone numbers
+PHONE_LIKE_PATTERN = r'\+?[\d\s\-\(\)\.]+'
+_PHONE_LIKE_RE = re.compile(PHONE_LIKE_PATTERN)  # Per-contact checks; pandas takes the string
+
+# validate_phone_numbers: characters removed when cleaning, and the accepted shape
+# Matches: +1234567890, 1234567890, +91-9876543210, etc.
+# Plain strings: they are only passed to pandas' vectorized .str methods
+_PHONE_CLEAN_PATTERN = r'[^\d\+\-\(\)\s]'
+_PHONE_VALID_PATTERN = r'[\+]?[1-9][\d\-\s\(\)]{7,15}'  # Applied with fullmatch
+
+
+class _DeletionTable(dict):
+    """
+    ``str.translate`` table deleting every character matched by a one-character regex.
+
+    Entries are filled in lazily on first sight of each character, so the table
+    covers all of Unicode with the exact semantics of ``re.sub(pattern, '', s)``
+    while lookups stay plain dict hits.
+    """
+
+    def __init__(self, pattern: str):
+        super().__init__()
+        self._pattern = re.compile(pattern)
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if self._pattern.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+# Strips a phone-like contact down to its digits: contact.translate(_PHONE_DIGITS_TABLE)
+_PHONE_DIGITS_TABLE = _DeletionTable(r'\D')
+
+# WhatsApp Web deep link that opens a chat directly with a prefilled message
+WHATSAPP_SEND_URL = "https://web.whatsapp.com/send?phone={phone}&text={text}"
+
+# Ready-made message templates returned by create_message_templates() (read-only)
+_MESSAGE_TEMPLATES = types.MappingProxyType({
+    'greeting': "Hello {name}! Hope you are having a wonderful day. This is an automated message from {sender}.",
+
+    'business_update': "Hi {name}, We have an exciting update about {topic}. {details} Thank you for your continued support!",
+
+    'reminder': "Hello {name}, This is a friendly reminder about {event} scheduled for {date}. Looking forward to seeing you there!",
+
+    'promotional': "Hi {name}! 🎉 Special offer just for you: {offer}. Valid until {expiry}. Don't miss out!",
+
+    'follow_up': "Hi {name}, Following up on our previous conversation about {topic}. Please let me know if you have any questions.",
+
+    'thank_you': "Dear {name}, Thank you so much for {reason}. Your support means a lot to us! Best regards, {sender}",
+
+    'invitation': "Hello {name}! You're invited to {event} on {date} at {location}. Hope to see you there! RSVP: {contact}"
+})
+
 # ==============================================================================
 #                           CONFIGURATION CONSTANTS
 # ==============================================================================
@@ -79,25 +186,31 @@ class Config:
     Modify these values to customize the behavior of the automation tool.
     """
 
-    # XPath selectors for WhatsApp Web elements
+    # CSS selectors for WhatsApp Web elements
+    # CSS is resolved by the browser's native querySelector, which is much
+    # faster than evaluating the equivalent XPath expressions.
     # Note: These may need updates if WhatsApp changes their interface
     SELECTORS = {
-        'search_box': "//div[@contenteditable='true'][@data-tab='3']",
-        'message_box': "//div[@contenteditable='true'][@data-tab='6']", 
-        'contact_title': "//span[@title='{}']",
-        'first_contact': "//div[@data-testid='cell-frame-container'][1]",
-        'qr_code': "//div[@data-ref]//canvas",
-        'send_button': "//button[@data-testid='compose-btn-send']",
-        'chat_header': "//header[@data-testid='conversation-header']",
-        'message_list': "//div[@data-testid='conversation-panel-messages']"
+        'search_box': "div[contenteditable='true'][data-tab='3']",
+        'message_box': "div[contenteditable='true'][data-tab='6']", 
+        'contact_title': "span[title={}]",  # Filled with a quoted CSS string
+        'first_contact': "div[data-testid='cell-frame-container']",
+        'qr_code': "div[data-ref] canvas",
+        'send_button': "button[data-testid='compose-btn-send']",
+        'chat_header': "header[data-testid='conversation-header']",
+        'message_list': "div[data-testid='conversation-panel-messages']",
+        'outgoing_message': "div.message-out"
     }
 
     # Timing configuration (all values in seconds)
     DELAYS = {
         'page_load_timeout': 20,        # Maximum time to wait for page elements
         'qr_scan_timeout': 60,          # Maximum time to wait for QR code scan
-        'search_delay': 2,              # Delay after searching for contact
-        'message_send_delay': 1,        # Delay after sending message
+        'action_jitter_min': 0.05,      # Minimum human-like pause between UI actions
+        'action_jitter_max': 0.2,       # Maximum human-like pause between UI actions
+        'send_confirm_timeout': 10,     # Maximum time to wait for a sent message to leave the input box
+        'poll_frequency': 0.05,         # How often explicit waits re-check their condition
+        'script_timeout': 30,           # Maximum run time of an injected async script
         'between_messages_min': 3,      # Minimum delay between messages
         'between_messages_max': 8,      # Maximum delay between messages
         'retry_delay': 5,               # Delay before retrying failed operations
@@ -117,9 +230,646 @@ class Config:
         'default_user_data': './whatsapp_user_data',
         'logs_directory': './logs',
         'backup_directory': './backups',
-        'sample_contacts_file': 'sample_contacts.csv'
+        'sample_contacts_file': 'sample_contacts.csv',
+        'state_database': 'state.db',   # Stored inside the user data directory
+        'driver_cache_file': '.wda_cache.json',  # Remembers the resolved ChromeDriver path
+        'report_file': 'report.jsonl'   # Per-contact outcomes, stored in the logs directory
+    }
+
+    # Media and analytics requests blocked in the browser (not needed to send text)
+    BLOCKED_URL_PATTERNS = [
+        '*/media/*',
+        '*.mp4',
+        '*.webp',
+        '*/emoji/*',
+        '*/profile-pics/*',
+        '*pps.whatsapp.net*',           # Profile pictures
+        '*google-analytics*',
+        '*facebook*/tr*'
+    ]
+
+    # Extra Chrome switches for additional pool workers: fewer renderer
+    # processes per browser, so each extra worker costs much less memory
+    WORKER_CHROME_ARGUMENTS = [
+        '--renderer-process-limit=1',
+        '--process-per-site',
+        '--disable-site-isolation-trials'
+    ]
+
+    # Contact file processing
+    PROCESSING = {
+        'contacts_chunk_size': 10_000,  # Rows loaded into memory at a time
+        'drop_duplicate_contacts': True, # Send at most one message per contact
+        'normalize_phone_numbers': True, # Validate/convert numbers to E.164 (needs phonenumbers)
+        'default_phone_region': None     # Region for numbers without a '+' prefix, e.g. 'US';
+                                         # None leaves such numbers as written
+    }
+
+    # ChromeDriver resolution
+    DRIVER = {
+        'path_env_var': 'WBM_CHROMEDRIVER',  # Set to a chromedriver path to skip WebDriverManager
+        'cache_ttl': 7 * 24 * 3600           # Re-check for driver updates once a week (seconds)
+    }
+
+    # Log file batching
+    LOGGING = {
+        'buffer_capacity': 200,         # Records held in memory before a batch is written
+        'file_buffer_size': 65536       # Bytes buffered by the log file before a write() syscall
     }
 
+    # WhatsApp Business Cloud API settings (optional HTTP backend)
+    # Leave the credentials unset to use the Selenium/WhatsApp Web backend
+    CLOUD_API = {
+        'base_url': 'https://graph.facebook.com',
+        'api_version': 'v20.0',
+        'phone_number_id': os.environ.get('WHATSAPP_PHONE_NUMBER_ID'),
+        'access_token': os.environ.get('WHATSAPP_ACCESS_TOKEN'),
+        # Approved message template for business-initiated sends; without one, messages go out
+        # as free-form text, which only reaches contacts who wrote to you in the last 24 hours
+        'template_name': os.environ.get('WHATSAPP_TEMPLATE_NAME'),
+        'template_language': os.environ.get('WHATSAPP_TEMPLATE_LANGUAGE', 'en_US'),
+        'template_param_separator': '|', # Splits a row's message into template body parameters
+        'request_timeout': 30           # Per-request timeout in seconds
+    }
+
+# ==============================================================================
+#                           INJECTED PAGE SCRIPTS
+# ==============================================================================
+
+# Runs before any page script on every document (registered once per driver),
+# so WhatsApp's own scripts never observe the automation markers
+STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+window.chrome = window.chrome || {runtime: {}};
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+const originalQuery = window.navigator.permissions && window.navigator.permissions.query;
+if (originalQuery) {
+    window.navigator.permissions.query = parameters => parameters.name === 'notifications'
+        ? Promise.resolve({state: Notification.permission})
+        : originalQuery.call(window.navigator.permissions, parameters);
+}
+"""
+
+# Opens a chat and sends a message entirely inside the page, so one contact
+# costs a single WebDriver round-trip instead of one per click/type/wait.
+# Arguments: contact, message, contact title selector, Config.SELECTORS,
+# per-step timeout (ms), Selenium async callback.
+# Result status: 'sent', 'fallback' (nothing typed yet, safe to retry the
+# step-by-step flow) or 'error' (the message may be in the input box).
+WHATSAPP_SEND_JS = """
+const [contact, message, titleSelector, sel, timeoutMs, done] = arguments;
+const q = s => document.querySelector(s);
+
+const waitFor = fn => new Promise((resolve, reject) => {
+    const found = fn();
+    if (found) return resolve(found);
+    const observer = new MutationObserver(() => {
+        const result = fn();
+        if (result) { observer.disconnect(); clearTimeout(timer); resolve(result); }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); reject(new Error('timeout')); }, timeoutMs);
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+});
+
+const typeInto = (el, text) => {
+    el.focus();
+    document.execCommand('selectAll', false, null);
+    document.execCommand('delete', false, null);
+    document.execCommand('insertText', false, text);
+};
+
+const press = el => ['mousedown', 'mouseup', 'click'].forEach(type =>
+    el.dispatchEvent(new MouseEvent(type, {bubbles: true, cancelable: true, view: window})));
+
+(async () => {
+    let stage = 'open';
+    try {
+        typeInto(await waitFor(() => q(sel.search_box)), contact);
+        const header = q(sel.chat_header);
+        const alreadyOpen = header && header.querySelector(titleSelector);
+        const previousBox = q(sel.message_box);
+        press(await waitFor(() => q(titleSelector)));
+        const box = await waitFor(() => {
+            const current = q(sel.message_box);
+            return current && (alreadyOpen || current !== previousBox) ? current : null;
+        });
+
+        stage = 'send';
+        typeInto(box, message);
+        const sendButton = await waitFor(() => q(sel.send_button));
+        const postedBefore = document.querySelectorAll(sel.outgoing_message).length;
+        sendButton.click();
+        await waitFor(() => document.querySelectorAll(sel.outgoing_message).length > postedBefore);
+        done({status: 'sent'});
+    } catch (e) {
+        done({status: stage === 'open' ? 'fallback' : 'error', err: String(e)});
+    }
+})();
+"""
+
+# ==============================================================================
+#                           RATE LIMITING
+# ==============================================================================
+
+class TokenBucket:
+    """
+    Token bucket rate limiter driven by ``time.monotonic()``.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``refill_rate`` tokens per second, so sends are spread evenly instead of
+    bursting at fixed window boundaries.
+
+    Attributes:
+        capacity (float): Maximum number of tokens the bucket can hold
+        refill_rate (float): Tokens added per second
+        tokens (float): Tokens currently available
+        last_refill (float): Monotonic timestamp of the last refill
+    """
+
+    def __init__(self, capacity: float, period_seconds: float):
+        """
+        Initialize a full token bucket.
+
+        Args:
+            capacity (float): Maximum number of sends allowed per period
+            period_seconds (float): Length of the period in seconds
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = capacity / period_seconds
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def wait_time(self, now: float) -> float:
+        """Return the seconds until one token is available (0 if available now)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.refill_rate
+
+    def consume(self) -> None:
+        """Take one token from the bucket."""
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    Thread-safe composite of per-minute, per-hour and per-day token buckets.
+
+    A send is only allowed when every tier has a token available, so the
+    strictest tier always wins. One limiter can be shared by several workers.
+    """
+
+    def __init__(self, per_minute: int, per_hour: int, per_day: int):
+        """
+        Initialize the limiter tiers.
+
+        Args:
+            per_minute (int): Maximum messages per minute
+            per_hour (int): Maximum messages per hour
+            per_day (int): Maximum messages per day
+        """
+        self.buckets = [
+            TokenBucket(per_minute, 60),
+            TokenBucket(per_hour, 3600),
+            TokenBucket(per_day, 86400)
+        ]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'RateLimiter':
+        """Build a limiter from ``Config.RATE_LIMITS``."""
+        return cls(
+            Config.RATE_LIMITS['max_messages_per_minute'],
+            Config.RATE_LIMITS['max_messages_per_hour'],
+            Config.RATE_LIMITS['max_messages_per_day']
+        )
+
+    def try_consume(self) -> float:
+        """
+        Take a token from every tier if all of them have one available.
+
+        Returns:
+            float: 0 if the send is allowed now, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(bucket.wait_time(now) for bucket in self.buckets)
+            if wait == 0:
+                for bucket in self.buckets:
+                    bucket.consume()
+            return wait
+
+    def consume_or_wait(self) -> float:
+        """
+        Block until a send is allowed, then consume it.
+
+        Returns:
+            float: Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_consume()
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def consume_or_wait_async(self) -> float:
+        """Asyncio variant of ``consume_or_wait`` that does not block the event loop."""
+        waited = 0.0
+        while True:
+            wait = self.try_consume()
+            if wait == 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+# ==============================================================================
+#                           SEND STATE PERSISTENCE
+# ==============================================================================
+
+class SentContactsStore:
+    """
+    SQLite-backed record of contacts messaged by each campaign run.
+
+    Lets an interrupted campaign resume without messaging anyone twice.
+    State is scoped to a campaign ID (see ``WhatsAppAutomation._campaign_id``)
+    and only an unfinished run is resumed: once a run completes, the next
+    run of the same campaign (e.g. the daily scheduled job) starts fresh.
+    The database runs in WAL mode with ``synchronous=NORMAL`` so each
+    insert is cheap while staying safe across crashes. Safe to share
+    between worker threads.
+    """
+
+    def __init__(self, db_path: str, campaign: str):
+        """
+        Open (and create if needed) the state database.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+            campaign (str): Campaign ID the recorded contacts belong to
+        """
+        self.db_path = db_path
+        self.campaign = campaign
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs (campaign TEXT PRIMARY KEY, started INTEGER, finished INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_contacts ("
+            "campaign TEXT, phone TEXT, ts INTEGER, status TEXT, PRIMARY KEY (campaign, phone))"
+        )
+        self._conn.commit()
+
+    def is_interrupted(self) -> bool:
+        """Return True if this campaign has a run that started but never finished."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT finished FROM runs WHERE campaign = ?", (self.campaign,)
+            ).fetchone()
+        return row is not None and row[0] is None
+
+    def load_sent(self) -> set:
+        """Return the set of contact keys already messaged by this campaign's current run."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute(
+                "SELECT phone FROM run_contacts WHERE campaign = ?", (self.campaign,)
+            )}
+
+    def start_run(self, fresh: bool) -> None:
+        """
+        Mark the campaign's run as started.
+
+        Args:
+            fresh (bool): If True, forget contacts recorded by earlier runs of the campaign
+        """
+        with self._lock:
+            if fresh:
+                self._conn.execute("DELETE FROM run_contacts WHERE campaign = ?", (self.campaign,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (campaign, started, finished) VALUES (?, ?, NULL)",
+                (self.campaign, int(time.time()))
+            )
+            self._conn.commit()
+
+    def finish_run(self) -> None:
+        """Mark the campaign's run as complete, so the next run does not resume it."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET finished = ? WHERE campaign = ?", (int(time.time()), self.campaign)
+            )
+            self._conn.commit()
+
+    def mark_sent(self, contact_key: str, status: str = 'sent') -> None:
+        """
+        Record a delivered message.
+
+        Args:
+            contact_key (str): Normalized contact key (see ``WhatsAppAutomation._contact_key``)
+            status (str): Delivery status to store
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO run_contacts (campaign, phone, ts, status) VALUES (?, ?, ?, ?)",
+                (self.campaign, contact_key, int(time.time()), status)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Forget all resume state, for every campaign."""
+        with self._lock:
+            self._conn.execute("DELETE FROM run_contacts")
+            self._conn.execute("DELETE FROM runs")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+# ==============================================================================
+#                           MESSAGING BACKENDS
+# ==============================================================================
+
+class Backend(ABC):
+    """
+    Base class for message delivery backends.
+
+    A backend knows how to deliver a single message to a single contact;
+    subclasses must implement ``send``.
+    Backends that can deliver many messages at once (``concurrent = True``)
+    additionally implement ``send_batch`` efficiently.
+    """
+
+    name = 'backend'
+    concurrent = False
+
+    @abstractmethod
+    def send(self, contact: str, message: str) -> bool:
+        """
+        Deliver one message to one contact.
+
+        Args:
+            contact (str): Contact name or phone number
+            message (str): Message text to send
+
+        Returns:
+            bool: True if the message was delivered, False otherwise
+        """
+
+    def send_batch(self, jobs: List[Tuple[str, str]],
+                   on_result: Optional[Callable[[str, bool], None]] = None) -> List[bool]:
+        """
+        Deliver a batch of messages.
+
+        Args:
+            jobs (list): List of (contact, message) tuples
+            on_result (callable, optional): Called with (contact, sent) as soon as
+                                            each job finishes
+
+        Returns:
+            list: One success flag per job, in the same order as ``jobs``
+        """
+        outcomes = []
+        for contact, message in jobs:
+            sent = self.send(contact, message)
+            if on_result is not None:
+                on_result(contact, sent)
+            outcomes.append(sent)
+        return outcomes
+
+
+class SeleniumBackend(Backend):
+    """
+    Legacy backend that drives WhatsApp Web through Selenium.
+
+    Messages are sent one at a time through the browser owned by the
+    given ``WhatsAppAutomation`` instance. Works with any personal account.
+    """
+
+    name = 'selenium'
+
+    def __init__(self, automation: 'WhatsAppAutomation'):
+        self.automation = automation
+
+    def send(self, contact: str, message: str) -> bool:
+        return self.automation.send_to_contact(contact, message)
+
+
+class CloudAPIBackend(Backend):
+    """
+    Backend that sends messages through the WhatsApp Business Cloud API.
+
+    Requests are issued over a shared ``aiohttp`` session and dispatched
+    concurrently, bounded by ``max_concurrency`` in-flight requests.
+    Contacts must be phone numbers in international format.
+
+    The Cloud API only delivers free-form text inside the 24-hour customer
+    service window (the contact wrote to you recently). Bulk outreach needs
+    an approved message template: with ``template_name`` set, each row's
+    message is split on ``Config.CLOUD_API['template_param_separator']`` into
+    the template's body parameters ({{1}}, {{2}}, ...).
+
+    Requires: pip install aiohttp
+    """
+
+    name = 'cloud_api'
+    concurrent = True
+
+    def __init__(self,
+                 phone_number_id: str,
+                 access_token: str,
+                 template_name: Optional[str] = None,
+                 template_language: str = 'en_US',
+                 max_concurrency: Optional[int] = None,
+                 logger: Optional[logging.Logger] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the Cloud API backend.
+
+        Args:
+            phone_number_id (str): WhatsApp Business phone number ID
+            access_token (str): Graph API access token
+            template_name (str, optional): Approved template to send; free-form text if None
+            template_language (str): Language code of the template (e.g. 'en_US')
+            max_concurrency (int, optional): Maximum number of in-flight requests.
+                                             Defaults to the per-minute rate limit.
+            logger (logging.Logger, optional): Logger for delivery diagnostics
+            rate_limiter (RateLimiter, optional): Limiter enforcing ``Config.RATE_LIMITS``
+        """
+        self.phone_number_id = phone_number_id
+        self.access_token = access_token
+        self.template_name = template_name
+        self.template_language = template_language
+        self.max_concurrency = max_concurrency or Config.RATE_LIMITS['max_messages_per_minute']
+        self.logger = logger or logging.getLogger('WhatsAppAutomation')
+        self.rate_limiter = rate_limiter or RateLimiter.from_config()
+        self.url = (f"{Config.CLOUD_API['base_url']}/{Config.CLOUD_API['api_version']}"
+                    f"/{phone_number_id}/messages")
+
+    @staticmethod
+    def is_configured() -> bool:
+        """Return True if Cloud API credentials are present in the configuration."""
+        return bool(Config.CLOUD_API['phone_number_id'] and Config.CLOUD_API['access_token'])
+
+    @classmethod
+    def from_config(cls, logger: Optional[logging.Logger] = None) -> 'CloudAPIBackend':
+        """Build a backend from the credentials and template in ``Config.CLOUD_API``."""
+        return cls(Config.CLOUD_API['phone_number_id'], Config.CLOUD_API['access_token'],
+                   template_name=Config.CLOUD_API['template_name'],
+                   template_language=Config.CLOUD_API['template_language'],
+                   logger=logger)
+
+    def send(self, contact: str, message: str) -> bool:
+        return self.send_batch([(contact, message)])[0]
+
+    def send_batch(self, jobs: List[Tuple[str, str]],
+                   on_result: Optional[Callable[[str, bool], None]] = None) -> List[bool]:
+        """
+        Send all jobs concurrently; see ``Backend.send_batch``.
+
+        ``on_result`` typically writes report files, so it runs on a single
+        background I/O thread rather than on the event loop. Outcomes are
+        recorded as each request completes without stalling in-flight sends.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='cloud-api-io') as io_executor:
+            return asyncio.run(self._send_all(jobs, on_result, io_executor))
+
+    async def _send_all(self, jobs: List[Tuple[str, str]],
+                        on_result: Optional[Callable[[str, bool], None]],
+                        io_executor: ThreadPoolExecutor) -> List[bool]:
+        """Send all jobs concurrently over one HTTP session."""
+        try:
+            import aiohttp
+        except ImportError:
+            self.logger.error("❌ 'aiohttp' library not installed. Install with: pip install aiohttp")
+            outcomes = [False] * len(jobs)
+            if on_result is not None:
+                for contact, _ in jobs:
+                    on_result(contact, False)
+            return outcomes
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        headers = {'Authorization': f"Bearer {self.access_token}"}
+        timeout = aiohttp.ClientTimeout(total=Config.CLOUD_API['request_timeout'])
+        loop = asyncio.get_running_loop()
+
+        async def send_and_record(contact: str, message: str) -> bool:
+            sent = await self._send_one(session, semaphore, contact, message)
+            if on_result is not None:
+                await loop.run_in_executor(io_executor, on_result, contact, sent)
+            return sent
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            return await asyncio.gather(*(
+                send_and_record(contact, message)
+                for contact, message in jobs
+            ))
+
+    async def _send_one(self, session, semaphore: asyncio.Semaphore, contact: str, message: str) -> bool:
+        """Send a single template (or free-form text) message through the Cloud API."""
+        phone = ''.join(ch for ch in contact if ch.isdigit())
+        if not phone:
+            self.logger.warning("❌ Cloud API requires a phone number, got '%s'", contact)
+            return False
+
+        payload = {'messaging_product': 'whatsapp', 'to': phone}
+        if self.template_name:
+            template = {'name': self.template_name, 'language': {'code': self.template_language}}
+            if message:
+                template['components'] = [{
+                    'type': 'body',
+                    'parameters': [
+                        {'type': 'text', 'text': value.strip()}
+                        for value in message.split(Config.CLOUD_API['template_param_separator'])
+                    ]
+                }]
+            payload.update(type='template', template=template)
+        else:
+            payload.update(type='text', text={'body': message})
+
+        async with semaphore:
+            await self.rate_limiter.consume_or_wait_async()
+            try:
+                async with session.post(self.url, json=payload) as response:
+                    if response.status == 200:
+                        return True
+                    body = await response.text()
+                    self.logger.error("❌ Cloud API error for %s (%s): %s", contact, response.status, body)
+                    return False
+            except Exception as e:
+                self.logger.error("❌ Cloud API request failed for %s: %s", contact, e)
+                return False
+
+# ==============================================================================
+#                           LOGGING HANDLERS
+# ==============================================================================
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer and leaves flushing to its caller.
+
+    ``logging.FileHandler`` flushes after every record, i.e. one ``write()``
+    syscall per log line. Used behind a ``BatchingMemoryHandler``, records
+    accumulate in the file buffer and reach disk once per batch.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 65536, encoding: Optional[str] = None):
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingMemoryHandler(MemoryHandler):
+    """``MemoryHandler`` that also flushes its target once each batch has been handed over."""
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            super().flush()
+            if self.target is not None:
+                self.target.flush()
+        finally:
+            self.release()
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    ``QueueListener`` that also accepts flush requests through its queue.
+
+    A flush request is a record carrying a ``flush_event`` attribute. Because
+    the queue is FIFO, every record logged before the request has been handled
+    when it arrives; the listener then flushes its handlers and sets the event.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        flush_event = getattr(record, 'flush_event', None)
+        if flush_event is None:
+            super().handle(record)
+            return
+        for handler in self.handlers:
+            handler.flush()
+        flush_event.set()
+
 # ==============================================================================
 #                           MAIN AUTOMATION CLASS
 # ==============================================================================
@@ -141,10 +891,21 @@ class WhatsAppAutomation:
         wait (WebDriverWait): WebDriverWait instance for element waiting
         user_data_dir (str): Path to Chrome user data directory
         headless (bool): Whether to run browser in headless mode
+        backend (Backend): Message delivery backend (Selenium by default)
+        rate_limiter (RateLimiter): Limiter enforcing Config.RATE_LIMITS across all sends
         logger (logging.Logger): Logger instance for operation tracking
     """
 
-    def __init__(self, user_data_dir: Optional[str] = None, headless: bool = False):
+    # Background log writer shared by all instances
+    _log_queue = None
+    _log_listener = None
+    _log_users = 0  # Open instances; the last one to close stops the writer
+    _log_lock = threading.Lock()
+    _driver_path = None  # ChromeDriver path resolved once per process
+    _dirs_created = False  # Shared logs/backup directories exist
+
+    def __init__(self, user_data_dir: Optional[str] = None, headless: bool = False,
+                 backend: Optional[Backend] = None):
         """
         Initialize the WhatsApp automation tool.
 
@@ -153,12 +914,28 @@ class WhatsAppAutomation:
                                          If None, uses default directory for persistent login.
             headless (bool): Whether to run Chrome in headless mode.
                            False by default for better debugging and monitoring.
+            backend (Backend, optional): Message delivery backend.
+                                       If None, messages are sent through WhatsApp Web.
         """
         # Initialize instance variables
         self.driver = None
         self.wait = None
+        self.confirm_wait = None
+        self._element_cache = {}
+        self._sent_store = None
+        self._report_file = None
+        self._report_lock = threading.Lock()  # Workers and the contact reader share the report
         self.user_data_dir = user_data_dir or Config.PATHS['default_user_data']
         self.headless = headless
+        self.backend = backend or SeleniumBackend(self)
+        self.extra_chrome_arguments = []
+
+        # Selenium locators and hot-path settings are bound once instead of looked up on every call
+        self._locators = {name: (By.CSS_SELECTOR, selector) for name, selector in Config.SELECTORS.items()}
+        self._selectors = Config.SELECTORS
+        self._page_load_timeout = Config.DELAYS['page_load_timeout']
+        self._action_jitter = (Config.DELAYS['action_jitter_min'], Config.DELAYS['action_jitter_max'])
+        self.rate_limiter = RateLimiter.from_config()
 
         # Statistics tracking
         self.session_stats = {
@@ -167,16 +944,23 @@ class WhatsAppAutomation:
             'contacts_processed': 0,
             'session_start_time': datetime.now()
         }
+        self._session_start_mono = time.monotonic()  # Session duration, immune to clock changes
+        self._last_stats_mono = float('-inf')  # When the formatted duration below was built
+        self._last_stats_formatted = ''
 
         # Create necessary directories
         self._create_directories()
 
         # Set up logging system
-        self._setup_logging()
+        with WhatsAppAutomation._log_lock:
+            self._setup_logging()
+            WhatsAppAutomation._log_users += 1
+        self._logging_released = False
 
         self.logger.info("WhatsApp Automation Tool initialized successfully")
         self.logger.info(f"User data directory: {self.user_data_dir}")
         self.logger.info(f"Headless mode: {self.headless}")
+        self.logger.info(f"Delivery backend: {self.backend.name}")
 
     def _create_directories(self) -> None:
         """
@@ -187,14 +971,15 @@ class WhatsAppAutomation:
         - Logs directory for operation logs
         - Backup directory for data backups
         """
-        directories = [
-            self.user_data_dir,
-            Config.PATHS['logs_directory'],
-            Config.PATHS['backup_directory']
-        ]
+        os.makedirs(self.user_data_dir, exist_ok=True)
 
-        for directory in directories:
+        # The shared directories only need creating once per process
+        if WhatsAppAutomation._dirs_created:
+            return
+
+        for directory in [Config.PATHS['logs_directory'], Config.PATHS['backup_directory']]:
             os.makedirs(directory, exist_ok=True)
+        WhatsAppAutomation._dirs_created = True
 
     def _setup_logging(self) -> None:
         """
@@ -202,16 +987,25 @@ class WhatsAppAutomation:
 
         Creates both file and console loggers with detailed formatting.
         Log files are rotated to prevent excessive disk usage.
+
+        File and console writes happen on a background ``QueueListener`` thread;
+        callers only enqueue records, so I/O latency never blocks the send loop.
+        The listener is shared by all instances (e.g. parallel workers) and
+        stopped when the last open instance is closed.
+        Records are written in batches of Config.LOGGING['buffer_capacity'];
+        errors and explicit ``_flush_logs()`` calls write immediately.
         """
-        # Create logs directory if it doesn't exist
-        os.makedirs(Config.PATHS['logs_directory'], exist_ok=True)
+        # Create logger
+        self.logger = logging.getLogger('WhatsAppAutomation')
+
+        # Already configured by an earlier instance and the writer is still running
+        if self.logger.handlers and WhatsAppAutomation._log_listener is not None:
+            return
 
         # Configure logging format
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         date_format = '%Y-%m-%d %H:%M:%S'
 
-        # Create logger
-        self.logger = logging.getLogger('WhatsAppAutomation')
         self.logger.setLevel(logging.INFO)
 
         # Remove existing handlers to prevent duplicates
@@ -219,20 +1013,79 @@ class WhatsAppAutomation:
 
         # File handler - logs to file
         log_file = os.path.join(Config.PATHS['logs_directory'], 'whatsapp_automation.log')
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(
+            log_file, buffer_size=Config.LOGGING['file_buffer_size'], encoding='utf-8'
+        )
         file_handler.setLevel(logging.INFO)
         file_formatter = logging.Formatter(log_format, date_format)
         file_handler.setFormatter(file_formatter)
 
+        # Batch records in memory and hand them to the file in one go
+        batch_handler = BatchingMemoryHandler(
+            capacity=Config.LOGGING['buffer_capacity'],
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+
         # Console handler - logs to terminal
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter('%(levelname)s - %(message)s')
         console_handler.setFormatter(console_formatter)
 
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Start the background writer once per process
+        if WhatsAppAutomation._log_listener is None:
+            WhatsAppAutomation._log_queue = queue.Queue(-1)
+            WhatsAppAutomation._log_listener = FlushingQueueListener(
+                WhatsAppAutomation._log_queue, batch_handler, console_handler, respect_handler_level=True
+            )
+            WhatsAppAutomation._log_listener.start()
+        else:
+            batch_handler.close()
+            file_handler.close()
+            console_handler.close()
+
+        # The logger itself only enqueues records
+        self.logger.addHandler(QueueHandler(WhatsAppAutomation._log_queue))
+
+    @classmethod
+    def _flush_logs(cls, timeout: float = 5.0) -> None:
+        """
+        Write every record logged so far to disk instead of waiting for a full batch.
+
+        The request goes through the log queue, so records still waiting there
+        are written too; the call returns once the listener thread has flushed.
+
+        Args:
+            timeout (float): Maximum seconds to wait for the writer thread
+        """
+        if cls._log_listener is not None:
+            flushed = threading.Event()
+            cls._log_queue.put_nowait(logging.makeLogRecord({'flush_event': flushed}))
+            flushed.wait(timeout)
+
+    @classmethod
+    def _stop_log_listener(cls) -> None:
+        """Flush queued log records to disk and stop the background writer."""
+        if cls._log_listener is not None:
+            cls._log_listener.stop()
+            for handler in cls._log_listener.handlers:
+                target = getattr(handler, 'target', None)  # MemoryHandler.close() drops its target
+                handler.close()
+                if target is not None:
+                    target.close()
+            cls._log_listener = None
+
+    def _release_logging(self) -> None:
+        """Give up this instance's use of the shared log writer, stopping it if no other instance is open."""
+        with WhatsAppAutomation._log_lock:
+            if self._logging_released:
+                return
+            self._logging_released = True
+            WhatsAppAutomation._log_users -= 1
+            if WhatsAppAutomation._log_users == 0:
+                self._stop_log_listener()
 
     def setup_driver(self) -> None:
         """
@@ -265,10 +1118,22 @@ class WhatsAppAutomation:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")  # Faster loading
-            chrome_options.add_argument("--disable-javascript")  # Disable unnecessary JS
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # Skip avatars and media
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--disable-web-security")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-default-apps")
+            chrome_options.add_argument("--disable-translate")
+            chrome_options.add_argument("--disable-component-update")
+            chrome_options.add_argument("--renderer-process-limit=2")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+
+            # Return from get() at DOMContentLoaded; explicit waits handle the rest
+            chrome_options.page_load_strategy = 'eager'
 
             # Privacy and security options
             chrome_options.add_argument("--disable-features=VizDisplayCompositor")
@@ -278,34 +1143,57 @@ class WhatsAppAutomation:
 
             # Headless mode if requested
             if self.headless:
-                chrome_options.add_argument("--headless")
+                chrome_options.add_argument("--headless=new")
                 chrome_options.add_argument("--window-size=1920,1080")
                 self.logger.info("Running in headless mode")
 
+            for argument in self.extra_chrome_arguments:
+                chrome_options.add_argument(argument)
+
             # User agent to avoid detection
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 
-            # Use WebDriverManager for automatic driver management
-            self.logger.info("Installing/updating ChromeDriver...")
-            service = Service(ChromeDriverManager().install())
+            # Reuse the cached ChromeDriver binary (WebDriverManager only runs when needed)
+            # and discard ChromeDriver's own log output
+            service = Service(self._resolve_chromedriver(), log_output=os.devnull)
 
             # Initialize WebDriver
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
 
-            # Configure WebDriver settings
-            self.driver.maximize_window()
-            self.driver.implicitly_wait(10)  # Implicit wait for elements
+            # Configure WebDriver settings: pin the viewport instead of maximizing (no relayout)
+            if self.headless:
+                # Nobody sees the page, so lay out and paint a smaller viewport
+                self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+                    'width': 1280, 'height': 720, 'deviceScaleFactor': 1, 'mobile': False
+                })
+            else:
+                self.driver.set_window_size(1920, 1080)
+            # No implicit wait: it would stack on top of every explicit wait's negative lookups
+
+            # Set up explicit waits once per driver; they are reused for every lookup.
+            # React re-renders can detach an element mid-lookup, so retry on stale references.
+            ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
+            self.wait = WebDriverWait(
+                self.driver,
+                Config.DELAYS['page_load_timeout'],
+                poll_frequency=Config.DELAYS['poll_frequency'],
+                ignored_exceptions=ignored_exceptions
+            )
+            self.confirm_wait = WebDriverWait(
+                self.driver,
+                Config.DELAYS['send_confirm_timeout'],
+                poll_frequency=Config.DELAYS['poll_frequency']
+            )
+            self._element_cache = {}
+            self.driver.set_script_timeout(Config.DELAYS['script_timeout'])
 
-            # Set up explicit wait
-            self.wait = WebDriverWait(self.driver, Config.DELAYS['page_load_timeout'])
+            # Never download avatars, media previews, emoji sprites or trackers
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': Config.BLOCKED_URL_PATTERNS})
 
-            # Execute script to hide automation indicators
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-            # Additional stealth measures
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            # Hide automation indicators before any page script runs
+            # (the user agent is already set through the --user-agent switch)
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_JS})
 
             self.logger.info("Chrome WebDriver initialized successfully")
 
@@ -319,6 +1207,57 @@ class WhatsAppAutomation:
             self.logger.error(f"Unexpected error during driver setup: {str(e)}")
             raise
 
+    def _resolve_chromedriver(self) -> str:
+        """
+        Return the path to the ChromeDriver binary.
+
+        Resolution order:
+        1. The ``WBM_CHROMEDRIVER`` environment variable (Config.DRIVER['path_env_var'])
+        2. The path already resolved by this process (shared by all instances)
+        3. The path cached in ``Config.PATHS['driver_cache_file']`` by an earlier
+           run, if the binary still exists and the entry is younger than
+           Config.DRIVER['cache_ttl']
+        4. WebDriverManager, whose result is then cached
+
+        Only the last step performs a network version check.
+
+        Returns:
+            str: Path to the ChromeDriver executable
+        """
+        env_path = os.environ.get(Config.DRIVER['path_env_var'])
+        if env_path:
+            return env_path
+
+        if WhatsAppAutomation._driver_path is not None:
+            return WhatsAppAutomation._driver_path
+
+        cache_file = Config.PATHS['driver_cache_file']
+
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            cached_path = cache.get('chromedriver')
+            is_fresh = time.time() - cache.get('resolved_at', 0) < Config.DRIVER['cache_ttl']
+            if cached_path and is_fresh and os.path.exists(cached_path):
+                self.logger.info(f"Using cached ChromeDriver: {cached_path}")
+                WhatsAppAutomation._driver_path = cached_path
+                return cached_path
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        # Use WebDriverManager for automatic driver management
+        self.logger.info("Installing/updating ChromeDriver...")
+        driver_path = ChromeDriverManager().install()
+
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'chromedriver': driver_path, 'resolved_at': int(time.time())}, f)
+        except OSError as e:
+            self.logger.warning(f"Could not cache ChromeDriver path: {str(e)}")
+
+        WhatsAppAutomation._driver_path = driver_path
+        return driver_path
+
     def login_to_whatsapp(self) -> bool:
         """
         Navigate to WhatsApp Web and handle the login process.
@@ -337,63 +1276,56 @@ class WhatsAppAutomation:
             self.logger.info("Navigating to WhatsApp Web...")
             self.driver.get("https://web.whatsapp.com")
 
-            # Wait for page to load
-            time.sleep(Config.DELAYS['startup_delay'])
+            # Wait for whichever appears first: the search box (logged in) or the QR code
+            search_box_locator = self._locators['search_box']
+            qr_code_locator = self._locators['qr_code']
+            try:
+                self.wait.until(EC.any_of(
+                    EC.presence_of_element_located(search_box_locator),
+                    EC.presence_of_element_located(qr_code_locator)
+                ))
+            except TimeoutException:
+                pass
 
             # Check if already logged in by looking for the search box
+            if self.driver.find_elements(*search_box_locator):
+                self.logger.info("✅ Already logged in to WhatsApp Web")
+                return True
+
+            # Not logged in, need to scan QR code
+            self.logger.info("Not logged in. QR code authentication required.")
+
+            # Wait for QR code to appear
             try:
-                search_box = self.wait.until(
-                    EC.presence_of_element_located((
-                        By.XPATH, 
-                        Config.SELECTORS['search_box']
-                    ))
+                self.logger.info("Waiting for QR code to appear...")
+                qr_code = self.wait.until(EC.presence_of_element_located(qr_code_locator))
+
+                self.logger.info("📱 QR code detected!")
+                print("\n" + "="*60)
+                print("           QR CODE AUTHENTICATION REQUIRED")
+                print("="*60)
+                print("1. Open WhatsApp on your phone")
+                print("2. Go to Settings > Linked Devices")
+                print("3. Tap 'Link a Device'")
+                print("4. Scan the QR code displayed in the browser")
+                print("5. Wait for the connection to complete")
+                print("="*60)
+
+                # Wait for login completion (search box appears)
+                self.logger.info(f"Waiting up to {Config.DELAYS['qr_scan_timeout']} seconds for QR code scan...")
+                search_box = WebDriverWait(self.driver, Config.DELAYS['qr_scan_timeout']).until(
+                    EC.presence_of_element_located(search_box_locator)
                 )
-                self.logger.info("✅ Already logged in to WhatsApp Web")
+
+                self.logger.info("✅ Successfully logged in to WhatsApp Web!")
+                print("\n🎉 Login successful! Starting automation...")
+
                 return True
 
             except TimeoutException:
-                # Not logged in, need to scan QR code
-                self.logger.info("Not logged in. QR code authentication required.")
-
-                # Wait for QR code to appear
-                try:
-                    self.logger.info("Waiting for QR code to appear...")
-                    qr_code = self.wait.until(
-                        EC.presence_of_element_located((
-                            By.XPATH, 
-                            Config.SELECTORS['qr_code']
-                        ))
-                    )
-
-                    self.logger.info("📱 QR code detected!")
-                    print("\n" + "="*60)
-                    print("           QR CODE AUTHENTICATION REQUIRED")
-                    print("="*60)
-                    print("1. Open WhatsApp on your phone")
-                    print("2. Go to Settings > Linked Devices")
-                    print("3. Tap 'Link a Device'")
-                    print("4. Scan the QR code displayed in the browser")
-                    print("5. Wait for the connection to complete")
-                    print("="*60)
-
-                    # Wait for login completion (search box appears)
-                    self.logger.info(f"Waiting up to {Config.DELAYS['qr_scan_timeout']} seconds for QR code scan...")
-                    search_box = WebDriverWait(self.driver, Config.DELAYS['qr_scan_timeout']).until(
-                        EC.presence_of_element_located((
-                            By.XPATH, 
-                            Config.SELECTORS['search_box']
-                        ))
-                    )
-
-                    self.logger.info("✅ Successfully logged in to WhatsApp Web!")
-                    print("\n🎉 Login successful! Starting automation...")
-
-                    return True
-
-                except TimeoutException:
-                    self.logger.error("❌ QR code scan timeout. Please try again.")
-                    print("\n⏰ Login timeout. Please restart the tool and try again.")
-                    return False
+                self.logger.error("❌ QR code scan timeout. Please try again.")
+                print("\n⏰ Login timeout. Please restart the tool and try again.")
+                return False
 
         except WebDriverException as e:
             self.logger.error(f"Navigation to WhatsApp Web failed: {str(e)}")
@@ -402,12 +1334,71 @@ class WhatsAppAutomation:
             self.logger.error(f"Unexpected error during login: {str(e)}")
             return False
 
+    def _find_cached(self, name: str) -> WebElement:
+        """
+        Locate a long-lived page element, reusing the previous lookup when still attached.
+
+        Only use this for elements that survive chat switches (e.g. the search box).
+        The cache is reset whenever a new driver session is created.
+
+        Args:
+            name (str): Key in Config.SELECTORS
+
+        Returns:
+            WebElement: The located element
+        """
+        element = self._element_cache.get(name)
+        if element is not None:
+            try:
+                element.is_enabled()  # Raises if the element was removed from the DOM
+                return element
+            except StaleElementReferenceException:
+                pass
+
+        element = self.wait.until(EC.presence_of_element_located(self._locators[name]))
+        self._element_cache[name] = element
+        return element
+
+    def _cdp_wait(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an enabled element to appear, polling inside the page.
+
+        The polling loop runs in the browser via DevTools ``Runtime.evaluate``
+        with ``awaitPromise``, so the whole wait costs one round-trip instead
+        of a WebDriver find/isDisplayed/isEnabled exchange every poll.
+
+        Args:
+            selector (str): CSS selector of the element to wait for
+            timeout (float, optional): Maximum time to wait in seconds.
+                                       Defaults to Config.DELAYS['page_load_timeout'].
+
+        Returns:
+            bool: True if the element appeared within ``timeout``
+        """
+        timeout_ms = int((timeout or self._page_load_timeout) * 1000)
+        expression = (
+            "new Promise(resolve => {"
+            f"  const ready = () => {{ const e = document.querySelector({json.dumps(selector)}); return !!e && !e.disabled; }};"
+            "  if (ready()) return resolve(true);"
+            "  const timer = setInterval(() => { if (ready()) { clearInterval(timer); resolve(true); } }, 50);"
+            f"  setTimeout(() => {{ clearInterval(timer); resolve(false); }}, {timeout_ms});"
+            "})"
+        )
+        response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True
+        })
+        return bool(response.get('result', {}).get('value'))
+
     def search_contact(self, contact: str) -> bool:
         """
         Search for a contact in WhatsApp and select it.
 
         This method handles both contact names and phone numbers.
-        It implements multiple search strategies to maximize success rate.
+        International ('+' prefixed) numbers open their chat directly through
+        the ``/send`` deep link; names and local numbers go through the search
+        box with multiple strategies to maximize success rate.
 
         Args:
             contact (str): Contact name or phone number to search for
@@ -415,72 +1406,150 @@ class WhatsAppAutomation:
         Returns:
             bool: True if contact found and selected successfully, False otherwise
         """
+        selectors = self._selectors
+
         try:
-            self.logger.info(f"Searching for contact: {contact}")
+            self.logger.info("Searching for contact: %s", contact)
+
+            # International numbers: open the chat directly via deep link, no search UI needed
+            phone = self._deep_link_phone(contact)
+            if phone:
+                self.driver.get(WHATSAPP_SEND_URL.format(phone=phone, text=''))
+                if not self._cdp_wait(selectors['message_box']):
+                    self.logger.warning("❌ Chat for '%s' did not open (invalid or unregistered number?)", contact)
+                    return False
+                self.logger.info("✅ Chat with '%s' opened via deep link", contact)
+                return True
 
-            # Find and clear search box
-            search_box = self.wait.until(
-                EC.element_to_be_clickable((
-                    By.XPATH, 
-                    Config.SELECTORS['search_box']
-                ))
-            )
+            # Find and clear search box (it persists across chats, so reuse it)
+            search_box = self.wait.until(EC.element_to_be_clickable(self._find_cached('search_box')))
 
             # Clear any existing text
             search_box.click()
             search_box.clear()
 
-            # Type the contact name/number
-            search_box.send_keys(contact)
+            # Paste the contact name/number
+            self._paste_text(search_box, contact)
 
-            # Wait for search results to appear
-            time.sleep(Config.DELAYS['search_delay'])
+            # No fixed pause: the waits below return as soon as results are rendered
 
-            # Strategy 1: Try to find exact match by title
-            try:
-                contact_element = self.wait.until(
-                    EC.element_to_be_clickable((
-                        By.XPATH, 
-                        Config.SELECTORS['contact_title'].format(contact)
-                    ))
-                )
-                contact_element.click()
-                self.logger.info(f"✅ Contact '{contact}' found and selected (exact match)")
+            # Strategy 1: Try to find exact match by title (polled inside the page)
+            title_selector = _contact_title_selector(contact)
+            if self._cdp_wait(title_selector):
+                self.driver.find_element(By.CSS_SELECTOR, title_selector).click()
+                self.logger.info("✅ Contact '%s' found and selected (exact match)", contact)
                 return True
 
-            except TimeoutException:
-                # Strategy 2: Click on first search result
-                try:
-                    self.logger.info("Exact match not found, trying first search result...")
-                    first_result = self.wait.until(
-                        EC.element_to_be_clickable((
-                            By.XPATH, 
-                            Config.SELECTORS['first_contact']
-                        ))
-                    )
-                    first_result.click()
-                    self.logger.info(f"✅ Contact '{contact}' selected (first result)")
-
-                    # Verify that we actually opened a chat
-                    time.sleep(1)
-                    try:
-                        self.wait.until(
-                            EC.presence_of_element_located((
-                                By.XPATH, 
-                                Config.SELECTORS['message_box']
-                            ))
-                        )
-                        return True
-                    except TimeoutException:
-                        self.logger.warning(f"⚠️ Could not verify chat opened for '{contact}'")
-                        return False
+            # Strategy 2: Click on first search result
+            self.logger.info("Exact match not found, trying first search result...")
+            if not self._cdp_wait(selectors['first_contact']):
+                self.logger.warning("❌ Contact '%s' not found in search results", contact)
+                return False
 
-                except TimeoutException:
-                    self.logger.warning(f"❌ Contact '{contact}' not found in search results")
-                    return False
+            self.driver.find_element(*self._locators['first_contact']).click()
+            self.logger.info("✅ Contact '%s' selected (first result)", contact)
+
+            # Verify that we actually opened a chat
+            if not self._cdp_wait(selectors['message_box']):
+                self.logger.warning("⚠️ Could not verify chat opened for '%s'", contact)
+                return False
+            return True
 
         except Exception as e:
-            self.logger.error(f"Error searching for contact '{contact}': {str(e)}")
+            self.logger.error("Error searching for contact '%s': %s", contact, e)
+            return False
+
+    @staticmethod
+    def _message_delay(delay_range: Tuple[float, float]) -> float:
+        """
+        Sample the pause before the next message.
+
+        Delays follow exponential (Poisson-process) inter-arrival times with a
+        mean at the middle of ``delay_range``, clipped to the range. Most
+        pauses land near the minimum, with occasional longer gaps, which looks
+        more like a person typing than a flat uniform spread. The rate limiter
+        still enforces the hard per-minute/hour/day ceiling.
+
+        Args:
+            delay_range (tuple): Min and max delay between messages in seconds
+
+        Returns:
+            float: Delay in seconds
+        """
+        low, high = delay_range
+        target_mean = (low + high) / 2
+        if target_mean <= 0:
+            return low  # e.g. (0, 0): no pause requested
+        return max(low, min(high, random.expovariate(1.0 / target_mean)))
+
+    def _wait_for_send_slot(self, next_send_at: float, delay_range: Tuple[float, float]) -> float:
+        """
+        Sleep until the next send is allowed and schedule the one after it.
+
+        The delay between messages is measured from the start of one send to
+        the start of the next, so time spent opening chats and sending counts
+        towards it and only the remaining deficit is slept.
+
+        Args:
+            next_send_at (float): ``time.monotonic()`` timestamp of the earliest allowed send
+            delay_range (tuple): Min and max delay between messages in seconds
+
+        Returns:
+            float: Earliest ``time.monotonic()`` timestamp for the following send
+        """
+        now = time.monotonic()
+        wait = next_send_at - now
+        if wait > 0:
+            self.logger.info("⏳ Waiting %.1f seconds before next message...", wait)
+            time.sleep(wait)
+            now = next_send_at
+        return now + self._message_delay(delay_range)
+
+    def _human_pause(self) -> None:
+        """Sleep for a short random jitter between UI actions."""
+        time.sleep(random.uniform(*self._action_jitter))
+
+    def _paste_text(self, element: WebElement, text: str) -> None:
+        """
+        Paste text into an input element in a single round-trip.
+
+        The element is focused, then the whole string is committed with the
+        DevTools ``Input.insertText`` command, which the page receives as real
+        text input (like an IME commit) instead of one key event per character.
+        Newlines are inserted as line breaks instead of being sent as Enter key
+        presses.
+
+        Args:
+            element (WebElement): Focusable input element
+            text (str): Text to insert
+        """
+        self.driver.execute_script("arguments[0].focus();", element)
+        self.driver.execute_cdp_cmd('Input.insertText', {'text': text})
+
+    def _outgoing_message_count(self) -> int:
+        """Return the number of outgoing message rows rendered in the open chat."""
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;",
+            self._selectors['outgoing_message']
+        )
+
+    def _wait_for_message_posted(self, previous_count: int) -> bool:
+        """
+        Wait until a new outgoing message row appears in the open chat.
+
+        Returns as soon as WhatsApp Web renders the sent message instead of
+        sleeping for a fixed time after pressing send.
+
+        Args:
+            previous_count (int): ``_outgoing_message_count()`` taken before sending
+
+        Returns:
+            bool: True if the message appeared within Config.DELAYS['send_confirm_timeout']
+        """
+        try:
+            self.confirm_wait.until(lambda driver: self._outgoing_message_count() > previous_count)
+            return True
+        except TimeoutException:
             return False
 
     def send_message(self, message: str, contact_name: str = "contact") -> bool:
@@ -498,62 +1567,419 @@ class WhatsAppAutomation:
             bool: True if message sent successfully, False otherwise
         """
         try:
-            self.logger.info(f"Sending message to {contact_name}...")
+            self.logger.info("Sending message to %s...", contact_name)
 
             # Find message input box
             message_box = self.wait.until(
-                EC.element_to_be_clickable((
-                    By.XPATH, 
-                    Config.SELECTORS['message_box']
-                ))
+                EC.element_to_be_clickable(self._locators['message_box'])
             )
 
             # Clear any existing text and focus on the input box
             message_box.click()
             message_box.clear()
 
-            # Type the message
-            # Note: Using send_keys instead of JavaScript to avoid detection
-            message_box.send_keys(message)
+            # Paste the whole message at once instead of one key event per character
+            self._paste_text(message_box, message)
+
+            # Pause briefly before sending
+            self._human_pause()
+
+            # Send the message by pressing Enter
+            posted_before = self._outgoing_message_count()
+            message_box.send_keys(Keys.ENTER)
+
+            # Wait until the sent message shows up in the chat
+            if not self._wait_for_message_posted(posted_before):
+                self.logger.error("❌ Could not confirm message was sent to %s", contact_name)
+                return False
+
+            self.logger.info("✅ Message sent successfully to %s", contact_name)
+            return True
+
+        except ElementClickInterceptedException:
+            self.logger.error("❌ Message box was intercepted for %s", contact_name)
+            return False
+        except TimeoutException:
+            self.logger.error("❌ Message box not found for %s", contact_name)
+            return False
+        except Exception as e:
+            self.logger.error("❌ Error sending message to %s: %s", contact_name, e)
+            return False
+
+    def send_to_contact(self, contact: str, message: str) -> bool:
+        """
+        Open a contact's chat and send a message using a single injected script.
+
+        International ('+' prefixed) numbers are sent through ``send_via_deep_link`` instead,
+        which opens the chat directly without touching the search box. For
+        names, the whole search → select → type → send sequence runs inside the page
+        (see ``WHATSAPP_SEND_JS``). If the chat cannot be opened that way (e.g. no
+        exact title match), falls back to ``search_contact`` + ``send_message``.
+
+        Args:
+            contact (str): Contact name or phone number
+            message (str): Message text to send
+
+        Returns:
+            bool: True if message sent successfully, False otherwise
+        """
+        self.logger.info("Sending message to %s...", contact)
+
+        # International numbers open their chat directly, skipping the search UI entirely
+        phone = self._deep_link_phone(contact)
+        if phone:
+            return self.send_via_deep_link(phone, message, contact)
+
+        try:
+            result = self.driver.execute_async_script(
+                WHATSAPP_SEND_JS,
+                contact,
+                message,
+                _contact_title_selector(contact),
+                self._selectors,
+                self._page_load_timeout * 1000
+            )
+        except WebDriverException as e:
+            result = {'status': 'error', 'err': str(e)}
+
+        status = result.get('status')
+        if status == 'sent':
+            self.logger.info("✅ Message sent successfully to %s", contact)
+            return True
+
+        if status == 'fallback':
+            self.logger.info("Fast path could not open chat for %s, using step-by-step flow", contact)
+            return self.search_contact(contact) and self.send_message(message, contact)
+
+        self.logger.error("❌ Error sending message to %s: %s", contact, result.get('err'))
+        return False
+
+    @staticmethod
+    def _deep_link_phone(contact: str) -> Optional[str]:
+        """
+        Return the digits of a phone-number contact usable in a deep link.
+
+        Only numbers written in international form (leading '+', as produced
+        by the E.164 normalization in ``iter_contacts``) qualify: the deep link
+        reads its digits as country code + number, so a local number such as
+        '0412 345 678' would reach someone else. Other contacts keep using the
+        search box, which matches them against the address book.
+
+        Args:
+            contact (str): Contact name or phone number
+
+        Returns:
+            Optional[str]: 7-15 digit international number, or None for names and local numbers
+        """
+        if not contact.startswith('+') or not _PHONE_LIKE_RE.fullmatch(contact):
+            return None
+        digits = contact.translate(_PHONE_DIGITS_TABLE)
+        return digits if 7 <= len(digits) <= 15 else None
+
+    def send_via_deep_link(self, phone: str, message: str, contact_name: str = "contact") -> bool:
+        """
+        Send a message by opening the chat through WhatsApp Web's ``/send`` deep link.
+
+        The link opens the chat with the message already in the input box, so
+        no search, result scan or contact click is needed; only the send button
+        is pressed.
+
+        Args:
+            phone (str): Phone number digits including country code
+            message (str): Message text to send
+            contact_name (str): Name of contact for logging purposes
+
+        Returns:
+            bool: True if message sent successfully, False otherwise
+        """
+        try:
+            self.driver.get(WHATSAPP_SEND_URL.format(phone=phone, text=urllib.parse.quote(message)))
+
+            send_button = self.wait.until(
+                EC.element_to_be_clickable(self._locators['send_button'])
+            )
+
+            self._human_pause()
+            posted_before = self._outgoing_message_count()
+            send_button.click()
+
+            # Wait until the sent message shows up in the chat
+            if not self._wait_for_message_posted(posted_before):
+                self.logger.error("❌ Could not confirm message was sent to %s", contact_name)
+                return False
+
+            self.logger.info("✅ Message sent successfully to %s", contact_name)
+            return True
+
+        except TimeoutException:
+            self.logger.error("❌ Chat for %s did not open (invalid or unregistered number?)", contact_name)
+        except Exception as e:
+            self.logger.error("❌ Error sending message to %s: %s", contact_name, e)
+
+        return False
+
+    def iter_contacts(self,
+                      contacts_file: str,
+                      contact_column: str = 'contact',
+                      message_column: str = 'message',
+                      chunksize: Optional[int] = None,
+                      exclude: Optional[set] = None,
+                      message_template: Optional[str] = None,
+                      on_skipped: Optional[Callable[[List[int]], None]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a contacts file as cleaned DataFrame chunks.
+
+        Only one chunk is held in memory at a time, so arbitrarily large
+        contact lists can be processed with a bounded memory footprint.
+        Both columns are stripped of surrounding whitespace and rows with a
+        missing contact or message are dropped. When ``phonenumbers`` is
+        installed, phone-number contacts are validated once at load time and
+        rewritten in E.164 format; invalid numbers are skipped. Numbers without
+        a '+' prefix are only normalized when Config.PROCESSING['default_phone_region']
+        is set.
+
+        Args:
+            contacts_file (str): Path to CSV or Excel file containing contacts and messages
+            contact_column (str): Column name for contacts in the file
+            message_column (str): Column name for messages in the file
+            chunksize (int, optional): Rows per chunk. Defaults to Config.PROCESSING['contacts_chunk_size'].
+            exclude (set, optional): Contact keys to leave out, e.g. contacts messaged in an earlier run
+            message_template (str, optional): Template such as "Hi {name}!" rendered from each row's
+                                              columns into the message column. The template is
+                                              compiled once for the whole file.
+            on_skipped (callable, optional): Called with the file row numbers (1 = first data row) of
+                                             the rows dropped from each chunk for a blank or 'nan'
+                                             contact or message, or a phone number that fails validation
+
+        Yields:
+            pd.DataFrame: Chunk containing only the contact and message columns
+
+        Raises:
+            FileNotFoundError: If the contacts file does not exist
+            ValueError: If the file format is unsupported or required columns are missing
+        """
+        if not os.path.exists(contacts_file):
+            raise FileNotFoundError(f"Contacts file not found: {contacts_file}")
+
+        pd = _get_pandas()
+        chunksize = chunksize or Config.PROCESSING['contacts_chunk_size']
+        file_extension = os.path.splitext(contacts_file)[1].lower()
+
+        # Only the columns needed to build messages are parsed
+        if message_template is not None:
+            render = compile_message_template(message_template)
+            required_columns = list(dict.fromkeys([contact_column] + template_fields(message_template)))
+        else:
+            render = None
+            required_columns = [contact_column, message_column]
+
+        # Read every column as text so phone numbers keep their leading '+' and zeros
+        if file_extension == '.csv':
+            columns = _csv_header(contacts_file)  # Already parsed if the file was validated
+            chunks = self._read_csv_chunks(contacts_file, required_columns, chunksize)
+            self.logger.info(f"Streaming CSV file ({CSV_ENGINE} engine, {chunksize} rows per chunk)")
+        elif file_extension in ['.xlsx', '.xls']:
+            # Excel readers cannot stream, so the sheet is loaded once and sliced
+            df = pd.read_excel(contacts_file, engine=EXCEL_ENGINE, dtype=str)
+            columns = list(df.columns)
+            chunks = (df.iloc[i:i + chunksize] for i in range(0, len(df), chunksize))
+            self.logger.info("Loaded Excel file successfully")
+        else:
+            raise ValueError(f"Unsupported file format: {file_extension}. Use .csv, .xlsx, or .xls files.")
+
+        # Validate required columns
+        missing_columns = [col for col in required_columns if col not in columns]
+        if missing_columns:
+            raise ValueError(f"Required columns not found: {missing_columns}. "
+                             f"Available columns: {columns}")
+
+        seen_contacts = set()
+        drop_duplicates = Config.PROCESSING['drop_duplicate_contacts']
+        normalize_phones = phonenumbers is not None and Config.PROCESSING['normalize_phone_numbers']
+        phone_region = Config.PROCESSING['default_phone_region']
+        rows_read = 0  # Chunk indexes restart per batch, so file row numbers are counted here
+
+        for chunk in chunks:
+            first_row = rows_read + 1
+            rows_read += len(chunk)
+
+            # Personalize messages from the row's own columns
+            if render is not None:
+                chunk = chunk.assign(**{message_column: [
+                    render(row) for row in chunk.fillna('').to_dict('records')
+                ]})
+
+            # Clean and validate data in one vectorized pass
+            contacts, has_contact = self._clean_text_column(chunk[contact_column])  # Clean contact names
+            messages, has_message = self._clean_text_column(chunk[message_column])  # Clean messages
+            valid = has_contact & has_message
+            chunk = pd.DataFrame({contact_column: contacts, message_column: messages})
+            chunk.index = pd.RangeIndex(first_row, first_row + len(chunk))  # Rows numbered as in the file
+            if not valid.all():
+                invalid_count = int((~valid).sum())
+                self.logger.warning(f"Skipping {invalid_count} rows with missing or invalid data")
+                if on_skipped is not None:
+                    on_skipped(chunk.index[~valid].tolist())
+                chunk = chunk[valid]
+
+            # Reject invalid phone numbers and store valid ones in E.164 form
+            if normalize_phones:
+                is_phone = chunk[contact_column].str.fullmatch(PHONE_LIKE_PATTERN)
+                if phone_region is None:
+                    # Without a default region a local number's country is unknown: leave it as written
+                    is_phone &= chunk[contact_column].str.startswith('+')
+                e164 = chunk.loc[is_phone, contact_column].map(_to_e164)
+                invalid = e164.isna()
+                if invalid.any():
+                    invalid_rows = e164.index[invalid]
+                    self.logger.warning(f"Skipping {len(invalid_rows)} invalid phone numbers")
+                    if on_skipped is not None:
+                        on_skipped(invalid_rows.tolist())
+                    chunk = chunk.drop(index=invalid_rows)
+                chunk.loc[e164.index[~invalid], contact_column] = e164[~invalid]
+
+            if not (drop_duplicates or exclude):
+                yield chunk
+                continue
+
+            keys = self._contact_keys(chunk[contact_column])
+
+            # Remove contacts that were messaged in a previous run
+            if exclude:
+                already_sent = keys.isin(exclude)
+                if already_sent.any():
+                    self.logger.info(f"Skipping {int(already_sent.sum())} contacts already messaged")
+                    chunk = chunk[~already_sent]
+                    keys = keys[~already_sent]
+
+            # Remove contacts already seen in this or an earlier chunk
+            if drop_duplicates:
+                duplicated = keys.duplicated() | keys.isin(seen_contacts)
+                if duplicated.any():
+                    self.logger.info(f"Dropped {int(duplicated.sum())} duplicate contacts")
+                    chunk = chunk[~duplicated]
+                    keys = keys[~duplicated]
+                seen_contacts.update(keys)
+
+            yield chunk
+
+    @staticmethod
+    def _clean_text_column(column: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Strip a text column and flag the cells that hold a usable value.
+
+        Blank cells and the literal text 'nan' (any case) are not usable. The
+        send path and validation share this rule, so the valid-row count shown
+        before sending matches what is actually sent.
+
+        Args:
+            column (pd.Series): Raw contact or message column
+
+        Returns:
+            tuple: (stripped column as text, boolean array of usable cells)
+        """
+        cleaned = column.fillna('').astype(str).str.strip()
+        usable = ((cleaned != '') & (cleaned.str.lower() != 'nan')).to_numpy(dtype=bool)
+        return cleaned, usable
+
+    @staticmethod
+    def _campaign_id(contacts_file: str, contact_column: str, message_column: str,
+                     message_template: Optional[str]) -> str:
+        """
+        Identify a campaign for resume purposes.
+
+        The ID covers the file (path, size and modification time), the columns
+        read and the template, so editing the file or the message starts a
+        new campaign instead of resuming an old one.
 
-            # Wait a moment before sending
-            time.sleep(Config.DELAYS['message_send_delay'])
+        Args:
+            contacts_file (str): Path to contacts file
+            contact_column (str): Column name for contacts
+            message_column (str): Column name for messages
+            message_template (str, optional): Campaign template
 
-            # Send the message by pressing Enter
-            message_box.send_keys(Keys.ENTER)
+        Returns:
+            str: Hex digest identifying the campaign
+        """
+        stat = os.stat(contacts_file)
+        key = json.dumps([os.path.abspath(contacts_file), stat.st_size, stat.st_mtime_ns,
+                          contact_column, message_column, message_template])
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
 
-            # Wait to ensure message is sent
-            time.sleep(Config.DELAYS['message_send_delay'])
+    @staticmethod
+    def _contact_keys(contacts: pd.Series) -> pd.Series:
+        """
+        Build a normalized identity key for each contact, for duplicate detection.
 
-            self.logger.info(f"✅ Message sent successfully to {contact_name}")
+        Phone numbers are reduced to their digits so '+1 (234) 567-890' and
+        '1234567890' match; names are compared case-insensitively.
 
-            # Update statistics
-            self.session_stats['messages_sent'] += 1
+        Args:
+            contacts (pd.Series): Cleaned contact column
 
-            return True
+        Returns:
+            pd.Series: Normalized keys aligned with ``contacts``
+        """
+        is_phone = contacts.str.fullmatch(PHONE_LIKE_PATTERN)
+        return contacts.str.replace(r'\D', '', regex=True).where(is_phone, contacts.str.lower())
+
+    @staticmethod
+    def _contact_key(contact: str) -> str:
+        """Scalar version of ``_contact_keys`` for a single contact."""
+        if _PHONE_LIKE_RE.fullmatch(contact):
+            return contact.translate(_PHONE_DIGITS_TABLE)
+        return contact.lower()
+
+    @staticmethod
+    def _read_csv_chunks(contacts_file: str, columns: List[str], chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield raw CSV chunks of the given columns, typed as string.
 
-        except ElementClickInterceptedException:
-            self.logger.error(f"❌ Message box was intercepted for {contact_name}")
-            return False
-        except TimeoutException:
-            self.logger.error(f"❌ Message box not found for {contact_name}")
-            return False
-        except Exception as e:
-            self.logger.error(f"❌ Error sending message to {contact_name}: {str(e)}")
-            self.session_stats['messages_failed'] += 1
-            return False
+        Uses pyarrow's streaming reader when available (multithreaded parsing,
+        chunks sized in bytes) and pandas' chunked C parser otherwise. Other
+        columns are skipped by the parser, and empty cells are read as ''
+        rather than going through NaN detection.
+
+        Args:
+            contacts_file (str): Path to CSV file
+            columns (list): Columns to read
+            chunksize (int): Approximate number of rows per chunk
+        """
+        if CSV_ENGINE == 'pyarrow':
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+
+            reader = pa_csv.open_csv(
+                contacts_file,
+                read_options=pa_csv.ReadOptions(block_size=chunksize * 256),  # ~256 bytes per row
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=columns,
+                    column_types={col: pa.string() for col in columns},
+                    strings_can_be_null=False
+                )
+            )
+            for batch in reader:
+                yield batch.to_pandas()
+        else:
+            yield from _get_pandas().read_csv(contacts_file, usecols=columns, dtype=str,
+                                   na_filter=False, chunksize=chunksize)
 
     def send_bulk_messages(self, 
                           contacts_file: str, 
                           message_column: str = 'message', 
                           contact_column: str = 'contact',
                           delay_range: Tuple[int, int] = (3, 8),
-                          dry_run: bool = False) -> Dict[str, Union[int, List[str]]]:
+                          dry_run: bool = False,
+                          num_workers: int = 1,
+                          resume: bool = True,
+                          message_template: Optional[str] = None) -> Dict[str, Union[int, List[str]]]:
         """
         Send bulk messages from a CSV or Excel file.
 
         This is the main bulk messaging method that processes a file of contacts
         and messages, sending them with appropriate delays and error handling.
+        The file is streamed in chunks, so sending starts as soon as the first
+        chunk is loaded and memory use does not grow with the file size.
 
         Args:
             contacts_file (str): Path to CSV or Excel file containing contacts and messages
@@ -561,6 +1987,16 @@ class WhatsAppAutomation:
             contact_column (str): Column name for contacts in the file
             delay_range (tuple): Min and max delay between messages in seconds
             dry_run (bool): If True, only validate data without sending messages
+            num_workers (int): Number of parallel Chrome drivers for the Selenium backend.
+                               Each extra worker uses its own Chrome profile directory
+                               (``<user_data_dir>_<n>``), which must be logged in as a
+                               separate linked device (QR scan on first use).
+            resume (bool): If True and the previous run of this campaign (same file, columns
+                           and template) was interrupted, skip the contacts it already messaged.
+                           Completed runs are never resumed, so re-running a campaign sends again.
+            message_template (str, optional): Campaign template (e.g. "Hi {name}!") filled from each
+                                              row's columns. When given, ``message_column`` is not
+                                              read from the file.
 
         Returns:
             dict: Detailed results summary containing:
@@ -582,65 +2018,71 @@ class WhatsAppAutomation:
             'processing_time': 0
         }
 
-        start_time = datetime.now()
+        start_mono = time.monotonic()  # Immune to wall-clock changes during long runs
 
         try:
             self.logger.info("="*60)
             self.logger.info("STARTING BULK MESSAGING OPERATION")
             self.logger.info("="*60)
 
-            # Validate file existence
-            if not os.path.exists(contacts_file):
-                raise FileNotFoundError(f"Contacts file not found: {contacts_file}")
-
             self.logger.info(f"Loading contacts from: {contacts_file}")
 
-            # Read contacts file based on extension
-            file_extension = os.path.splitext(contacts_file)[1].lower()
-
-            if file_extension == '.csv':
-                df = pd.read_csv(contacts_file)
-                self.logger.info("Loaded CSV file successfully")
-            elif file_extension in ['.xlsx', '.xls']:
-                df = pd.read_excel(contacts_file)
-                self.logger.info("Loaded Excel file successfully")
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}. Use .csv, .xlsx, or .xls files.")
-
-            # Validate required columns
-            missing_columns = []
-            if contact_column not in df.columns:
-                missing_columns.append(contact_column)
-            if message_column not in df.columns:
-                missing_columns.append(message_column)
-
-            if missing_columns:
-                raise ValueError(f"Required columns not found: {missing_columns}. "
-                               f"Available columns: {list(df.columns)}")
-
-            # Clean and validate data
-            df = df.dropna(subset=[contact_column, message_column])  # Remove rows with missing data
-            df[contact_column] = df[contact_column].astype(str).str.strip()  # Clean contact names
-            df[message_column] = df[message_column].astype(str).str.strip()  # Clean messages
-
-            results['total'] = len(df)
+            # Contacts messaged by an interrupted run of this campaign are recorded in the state database
+            self._sent_store = SentContactsStore(
+                os.path.join(self.user_data_dir, Config.PATHS['state_database']),
+                self._campaign_id(contacts_file, contact_column, message_column, message_template)
+            )
+            already_sent = None
+            if resume and self._sent_store.is_interrupted():
+                already_sent = self._sent_store.load_sent()
+                self.logger.info(f"Resuming interrupted run: {len(already_sent)} contacts already messaged")
+
+            # Line-buffered, append-only report: one JSON object per contact outcome
+            self._report_file = open(
+                os.path.join(Config.PATHS['logs_directory'], Config.PATHS['report_file']),
+                'a', buffering=1, encoding='utf-8'
+            )
 
-            if results['total'] == 0:
-                self.logger.warning("No valid contacts found in file")
+            # Skipped rows go to the report only once the user has confirmed the run
+            unreported_rows = []
+            report_skipped = False
+
+            def record_skipped(rows: List[int]) -> None:
+                results['skipped'] += len(rows)
+                results['skipped_contacts'].extend(f"Row {row}" for row in rows)
+                if not report_skipped:
+                    unreported_rows.extend(rows)
+                    return
+                for row in rows:
+                    self._record_result(None, 'skipped', row=row)
+
+            # Load up to the first chunk with contacts left after filtering; the rest is streamed while sending
+            chunks = self.iter_contacts(contacts_file, contact_column, message_column,
+                                        exclude=already_sent, message_template=message_template,
+                                        on_skipped=record_skipped)
+            first_chunk = next((chunk for chunk in chunks if not chunk.empty), None)
+
+            if first_chunk is None:
+                # Every chunk was read without a contact left to send: only now is the interrupted run complete
+                if already_sent and not dry_run:
+                    self.logger.info("All contacts were already messaged by the interrupted run")
+                    self._sent_store.finish_run()
+                else:
+                    self.logger.warning("No valid contacts found in file")
                 return results
 
-            self.logger.info(f"Found {results['total']} valid contacts to process")
-
             if dry_run:
                 self.logger.info("DRY RUN MODE - No messages will be sent")
-                self._display_contacts_preview(df, contact_column, message_column)
+                self._display_contacts_preview(first_chunk, contact_column, message_column)
+                results['total'] = len(first_chunk) + sum(len(chunk) for chunk in chunks)
+                self.logger.info(f"Found {results['total']} valid contacts to process")
                 return results
 
             # Display preview and get confirmation
-            self._display_contacts_preview(df, contact_column, message_column, limit=5)
+            self._display_contacts_preview(first_chunk, contact_column, message_column, limit=5)
 
             # Confirm before proceeding
-            print(f"\n📊 Ready to send {results['total']} messages")
+            print(f"\n📊 Ready to send messages from {contacts_file}")
             confirm = input("Do you want to proceed? (yes/no): ").lower().strip()
 
             if confirm != 'yes':
@@ -651,55 +2093,54 @@ class WhatsAppAutomation:
             print("\n🚀 Starting bulk messaging...")
             print("="*60)
 
+            self._sent_store.start_run(fresh=already_sent is None)
+            for row in unreported_rows:
+                self._record_result(None, 'skipped', row=row)
+            report_skipped = True
+            all_chunks = itertools.chain([first_chunk], chunks)
+
+            # Concurrent backends deliver each chunk as one batch
+            if self.backend.concurrent:
+                for chunk in all_chunks:
+                    results['total'] += len(chunk)
+                    self._send_batch_with_backend(chunk, contact_column, message_column, results)
+
+            # Spread contacts across a pool of independent browsers
+            elif num_workers > 1:
+                self._send_with_worker_pool(all_chunks, contact_column, message_column,
+                                            results, delay_range, num_workers)
+
             # Process each contact
-            for index, row in df.iterrows():
-                contact = str(row[contact_column]).strip()
-                message = str(row[message_column]).strip()
-
-                # Skip empty contacts or messages
-                if not contact or not message or contact.lower() == 'nan' or message.lower() == 'nan':
-                    self.logger.warning(f"Skipping row {index + 1}: Missing or invalid data")
-                    results['skipped'] += 1
-                    results['skipped_contacts'].append(f"Row {index + 1}")
-                    continue
-
-                # Progress indicator
-                progress = f"[{index + 1}/{results['total']}]"
-                print(f"\n{progress} Processing: {contact}")
-                self.logger.info(f"{progress} Processing contact: {contact}")
-
-                # Update statistics
-                self.session_stats['contacts_processed'] += 1
-
-                # Search for contact
-                if self.search_contact(contact):
-                    # Send message
-                    if self.send_message(message, contact):
-                        results['successful'] += 1
-                        print(f"✅ Message sent to {contact}")
-                    else:
-                        results['failed'] += 1
-                        results['failed_contacts'].append(contact)
-                        print(f"❌ Failed to send message to {contact}")
-                else:
-                    results['failed'] += 1
-                    results['failed_contacts'].append(contact)
-                    print(f"❌ Contact not found: {contact}")
+            else:
+                position = 0
+                next_send_at = time.monotonic()
+                for chunk in all_chunks:
+                    results['total'] += len(chunk)
+
+                    contacts = chunk[contact_column].to_numpy(dtype=object)
+                    messages = chunk[message_column].to_numpy(dtype=object)
+                    for contact, message in zip(contacts, messages):
+                        position += 1
 
-                # Progress summary
-                success_rate = (results['successful'] / (index + 1)) * 100 if (index + 1) > 0 else 0
-                print(f"📈 Progress: {success_rate:.1f}% success rate")
+                        # Random delay between messages, minus the time the last send took
+                        next_send_at = self._wait_for_send_slot(next_send_at, delay_range)
 
-                # Random delay between messages (except for last message)
-                if index < len(df) - 1:
-                    delay = random.uniform(delay_range[0], delay_range[1])
-                    print(f"⏳ Waiting {delay:.1f} seconds before next message...")
-                    self.logger.info(f"Waiting {delay:.1f} seconds before next message")
-                    time.sleep(delay)
+                        # Progress indicator
+                        self.logger.info("[%d/%d] Processing: %s", position, results['total'], contact)
+
+                        sent = self._process_single(contact, message, results)
+
+                        # One line per contact with the running success rate
+                        self.logger.info("[%d/%d] %s → %s (📈 %.1f%% success rate)",
+                                         position, results['total'], contact,
+                                         "✅ sent" if sent else "❌ failed",
+                                         results['successful'] / position * 100)
+
+            # Every contact was attempted: the next run of this campaign starts fresh
+            self._sent_store.finish_run()
 
             # Calculate processing time
-            end_time = datetime.now()
-            results['processing_time'] = (end_time - start_time).total_seconds()
+            results['processing_time'] = time.monotonic() - start_mono
 
             # Log final summary
             self._log_final_summary(results)
@@ -717,11 +2158,260 @@ class WhatsAppAutomation:
             print(f"❌ Unexpected error: {str(e)}")
         finally:
             # Always calculate processing time
-            end_time = datetime.now()
-            results['processing_time'] = (end_time - start_time).total_seconds()
+            results['processing_time'] = time.monotonic() - start_mono
+
+            if self._sent_store is not None:
+                self._sent_store.close()
+                self._sent_store = None
+            if self._report_file is not None:
+                self._report_file.close()
+                self._report_file = None
+
+            # Make sure batched log lines reach disk even if the run crashed
+            self._flush_logs()
 
         return results
 
+    def _process_single(self, contact: str, message: str, results: Dict,
+                        worker: Optional['WhatsAppAutomation'] = None,
+                        lock: Optional[threading.Lock] = None) -> bool:
+        """
+        Rate-limit, deliver and record one message.
+
+        Shared by the sequential loop and the worker pool so both count and
+        report outcomes the same way.
+
+        Args:
+            contact (str): Contact name or phone number
+            message (str): Message text to send
+            results (dict): Results dictionary to update in place
+            worker (WhatsAppAutomation, optional): Instance whose backend delivers the
+                                                   message. Defaults to this instance.
+            lock (threading.Lock, optional): Lock guarding ``results`` and session
+                                             statistics when called from pool workers
+
+        Returns:
+            bool: True if the message was sent successfully
+        """
+        worker = worker or self
+
+        # Respect per-minute/hour/day limits before sending
+        waited = self.rate_limiter.consume_or_wait()
+        if waited:
+            self.logger.info("Rate limit reached, waited %.1f seconds", waited)
+
+        # Deliver message through the configured backend
+        sent = worker.backend.send(contact, message)
+
+        with lock or contextlib.nullcontext():
+            if sent:
+                results['successful'] += 1
+                self._record_result(contact, 'sent')
+            else:
+                results['failed'] += 1
+                results['failed_contacts'].append(contact)
+                self._record_result(contact, 'failed')
+
+        return sent
+
+    def _record_result(self, contact: Optional[str], status: str, row: Optional[int] = None) -> None:
+        """
+        Append a per-contact outcome to the JSONL report and persist successful sends.
+
+        Each outcome is written as one line as soon as it happens, so the report
+        survives crashes and never has to be held in memory. Sent and failed
+        outcomes are also counted in ``session_stats`` here, and only here, so
+        every backend and worker is counted the same way. Pool workers call
+        this under their shared lock.
+
+        Args:
+            contact (str, optional): Contact the outcome belongs to; None for a skipped row
+            status (str): 'sent', 'failed' or 'skipped'
+            row (int, optional): File row number, written for skipped rows that have no usable contact
+        """
+        if self._report_file is not None:
+            record = {'contact': contact, 'status': status, 'ts': int(time.time())}
+            if row is not None:
+                record = {'contact': contact, 'row': row, **record}
+            with self._report_lock:
+                self._report_file.write(json.dumps(record) + '\n')
+        if status == 'sent' and self._sent_store is not None:
+            self._sent_store.mark_sent(self._contact_key(contact))
+        if status != 'skipped':
+            self.session_stats['contacts_processed'] += 1
+            self.session_stats['messages_sent' if status == 'sent' else 'messages_failed'] += 1
+
+    def _send_batch_with_backend(self, df: pd.DataFrame, contact_col: str, message_col: str, results: Dict) -> None:
+        """
+        Deliver a chunk of messages through a concurrent backend in a single batch.
+
+        Args:
+            df (pd.DataFrame): DataFrame containing contacts and messages
+            contact_col (str): Name of the contact column
+            message_col (str): Name of the message column
+            results (dict): Results dictionary to update in place
+        """
+        jobs = list(zip(df[contact_col], df[message_col]))
+        self.logger.info(f"Dispatching {len(jobs)} messages via {self.backend.name} backend")
+
+        def on_result(contact: str, sent: bool) -> None:
+            if sent:
+                results['successful'] += 1
+                self._record_result(contact, 'sent')
+            else:
+                results['failed'] += 1
+                results['failed_contacts'].append(contact)
+                self._record_result(contact, 'failed')
+
+        # Outcomes are recorded by the backend as each send completes
+        self.backend.send_batch(jobs, on_result=on_result)
+
+    def _send_with_worker_pool(self,
+                               chunks: Iterator[pd.DataFrame],
+                               contact_col: str,
+                               message_col: str,
+                               results: Dict,
+                               delay_range: Tuple[int, int],
+                               num_workers: int) -> None:
+        """
+        Send messages in parallel using a pool of Chrome drivers.
+
+        The current instance acts as the first worker; every additional worker
+        gets its own ``WhatsAppAutomation`` with its own Chrome profile
+        (``<user_data_dir>_<n>``). Each profile is a separate linked device:
+        the first time a worker starts, its browser shows a QR code that must
+        be scanned before it takes part. The calling thread streams chunks
+        into a bounded queue that all workers pull contacts from. Every
+        worker, this instance included, records outcomes through
+        ``_process_single`` under one lock, so ``results`` and
+        ``session_stats`` are never updated concurrently.
+
+        Workers cannot share one browser as tabs: WhatsApp Web allows only one
+        active tab per profile ("WhatsApp is open in another window") and a
+        WebDriver session drives one tab at a time. Extra workers instead run
+        with ``Config.WORKER_CHROME_ARGUMENTS`` to keep their footprint small.
+
+        Args:
+            chunks (iterator): Cleaned DataFrame chunks from ``iter_contacts``
+            contact_col (str): Name of the contact column
+            message_col (str): Name of the message column
+            results (dict): Results dictionary to update in place
+            delay_range (tuple): Min and max delay between messages per worker
+            num_workers (int): Total number of browser workers
+        """
+        jobs = queue.Queue(maxsize=Config.PROCESSING['contacts_chunk_size'])
+        lock = threading.Lock()
+        self.logger.info(f"Starting {num_workers} parallel workers")
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(self._run_worker, self, jobs, results, lock, delay_range)]
+            futures += [
+                executor.submit(self._run_extra_worker, worker_id, jobs, results, lock, delay_range)
+                for worker_id in range(1, num_workers)
+            ]
+
+            def put_job(job: Optional[Tuple[int, str, str]]) -> None:
+                """Queue a job, failing instead of blocking forever once every worker has stopped."""
+                while True:
+                    try:
+                        jobs.put(job, timeout=1.0)
+                        return
+                    except queue.Full:
+                        if all(future.done() for future in futures):
+                            raise RuntimeError("All workers stopped; remaining contacts were not sent")
+
+            position = 0
+            try:
+                for chunk in chunks:
+                    with lock:
+                        results['total'] += len(chunk)
+                    contacts = chunk[contact_col].to_numpy(dtype=object)
+                    messages = chunk[message_col].to_numpy(dtype=object)
+                    for contact, message in zip(contacts, messages):
+                        position += 1
+                        put_job((position, contact, message))
+            except BaseException:
+                # Reading the file failed (or no worker is left): abandon the queued
+                # contacts so the workers reach their stop markers right away
+                while True:
+                    try:
+                        jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                raise
+            finally:
+                # One stop marker per worker, also when the producer failed,
+                # so the executor does not wait forever on workers blocked in jobs.get()
+                for _ in range(num_workers):
+                    try:
+                        put_job(None)
+                    except RuntimeError:
+                        break
+
+            for future in futures:
+                future.result()
+
+    def _run_extra_worker(self, worker_id: int, jobs: queue.Queue, results: Dict,
+                          lock: threading.Lock, delay_range: Tuple[int, int]) -> None:
+        """
+        Start an additional browser worker and let it drain the job queue.
+
+        The worker's profile is never copied from the main one: a cloned profile
+        would run the same linked-device session in several browsers at once,
+        which WhatsApp Web does not allow. A new profile logs in by QR code.
+
+        Args:
+            worker_id (int): Worker number, used to derive the profile directory
+            jobs (queue.Queue): Shared queue of (position, contact, message) jobs
+            results (dict): Shared results dictionary
+            lock (threading.Lock): Lock guarding ``results`` and session statistics
+            delay_range (tuple): Min and max delay between messages
+        """
+        worker_dir = f"{self.user_data_dir}_{worker_id}"
+        if not os.path.isdir(worker_dir):
+            self.logger.warning(f"📱 Worker {worker_id} uses a new profile ({worker_dir}); "
+                                f"scan its QR code to link it as a separate device")
+
+        worker = WhatsAppAutomation(user_data_dir=worker_dir, headless=self.headless)
+        worker.extra_chrome_arguments = Config.WORKER_CHROME_ARGUMENTS
+        try:
+            worker.setup_driver()
+            if not worker.login_to_whatsapp():
+                self.logger.error(f"❌ Worker {worker_id} failed to login, leaving its share to other workers")
+                return
+            self._run_worker(worker, jobs, results, lock, delay_range)
+        except Exception as e:
+            self.logger.error(f"❌ Worker {worker_id} stopped: {str(e)}")
+        finally:
+            if worker.driver:
+                worker.driver.quit()
+            worker._release_logging()  # Lets the last close() stop the shared log writer
+
+    def _run_worker(self, worker: 'WhatsAppAutomation', jobs: queue.Queue, results: Dict,
+                    lock: threading.Lock, delay_range: Tuple[int, int]) -> None:
+        """
+        Drain the shared job queue using the given worker's browser.
+
+        Args:
+            worker (WhatsAppAutomation): Logged-in automation instance to send with
+            jobs (queue.Queue): Shared queue of (position, contact, message) jobs, ending with None
+            results (dict): Shared results dictionary
+            lock (threading.Lock): Lock guarding ``results`` and session statistics
+            delay_range (tuple): Min and max delay between messages
+        """
+        next_send_at = time.monotonic()
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            position, contact, message = job
+
+            next_send_at = self._wait_for_send_slot(next_send_at, delay_range)
+            sent = self._process_single(contact, message, results, worker=worker, lock=lock)
+
+            self.logger.info("[%d/%d] %s → %s", position, results['total'], contact,
+                             "✅ sent" if sent else "❌ failed")
+
     def _display_contacts_preview(self, df: pd.DataFrame, contact_col: str, message_col: str, limit: int = 5) -> None:
         """
         Display a preview of contacts and messages to be processed.
@@ -736,12 +2426,10 @@ class WhatsAppAutomation:
         print("           CONTACTS PREVIEW")
         print("="*60)
 
-        preview_df = df.head(limit)
+        preview_df = df.head(limit)[[contact_col, message_col]]
 
-        for index, row in preview_df.iterrows():
-            contact = row[contact_col]
-            message = row[message_col]
-            print(f"\n{index + 1}. Contact: {contact}")
+        for index, (contact, message) in enumerate(preview_df.itertuples(index=False), start=1):
+            print(f"\n{index}. Contact: {contact}")
             print(f"   Message: {message[:100]}{'...' if len(message) > 100 else ''}")
 
         if len(df) > limit:
@@ -771,6 +2459,7 @@ class WhatsAppAutomation:
 
         for line in summary_lines:
             self.logger.info(line)
+        self._flush_logs()
 
         # Display summary to user
         print("\n" + "="*60)
@@ -828,7 +2517,7 @@ class WhatsAppAutomation:
         ]
 
         # Create DataFrame and save to CSV
-        df = pd.DataFrame(sample_data)
+        df = _get_pandas().DataFrame(sample_data)
         df.to_csv(filename, index=False, encoding='utf-8')
 
         self.logger.info(f"Sample contacts file created: {filename}")
@@ -836,7 +2525,7 @@ class WhatsAppAutomation:
         # Display file structure
         print(f"\n📄 Sample file '{filename}' created successfully!")
         print("\nFile structure:")
-        print(df.to_string(index=False))
+        df.to_csv(sys.stdout, index=False)
         print(f"\n💡 Edit this file with your own contacts and messages, then run the tool again.")
 
         return filename
@@ -867,47 +2556,216 @@ class WhatsAppAutomation:
                 validation_results['issues'].append(f"File not found: {filename}")
                 return validation_results
 
-            # Read file
+            # Stream the file instead of loading it whole: CSV in vectorized chunks, Excel row by row.
+            # The header is checked first so a misconfigured file is rejected without reading its rows.
             if filename.endswith('.csv'):
-                df = pd.read_csv(filename)
+                header = _csv_header(filename)
+                if self._check_required_columns(validation_results, header, contact_col, message_col):
+                    chunks = self._read_csv_chunks(filename, [contact_col, message_col],
+                                                   Config.PROCESSING['contacts_chunk_size'])
+                    self._tally_contact_chunks(validation_results, chunks, contact_col, message_col)
+            elif filename.endswith('.xlsx'):
+                from openpyxl import load_workbook
+
+                workbook = load_workbook(filename, read_only=True, data_only=True)
+                try:
+                    rows = workbook.active.iter_rows(values_only=True)
+                    header = list(next(rows, ()))
+                    if self._check_required_columns(validation_results, header, contact_col, message_col):
+                        self._tally_contact_rows(validation_results, header, rows, contact_col, message_col)
+                finally:
+                    workbook.close()
             else:
-                df = pd.read_excel(filename)
+                pd = _get_pandas()
+                header = list(pd.read_excel(filename, engine=EXCEL_ENGINE, nrows=0).columns)
+                if self._check_required_columns(validation_results, header, contact_col, message_col):
+                    # Parse only the two inspected columns, as text
+                    df = pd.read_excel(filename, engine=EXCEL_ENGINE, dtype=str,
+                                       usecols=[contact_col, message_col])
+                    self._tally_contact_chunks(validation_results, [df], contact_col, message_col)
 
-            validation_results['total_rows'] = len(df)
+            validation_results['valid'] = not validation_results['issues'] and validation_results['valid_rows'] > 0
 
-            # Check required columns
-            if contact_col not in df.columns:
-                validation_results['issues'].append(f"Missing required column: {contact_col}")
-            if message_col not in df.columns:
-                validation_results['issues'].append(f"Missing required column: {message_col}")
+        except Exception as e:
+            validation_results['issues'].append(f"Error reading file: {str(e)}")
 
-            if validation_results['issues']:
-                return validation_results
+        return validation_results
+
+    @staticmethod
+    def _check_required_columns(validation_results: Dict, header: List,
+                                contact_col: str, message_col: str) -> bool:
+        """
+        Record an issue for each required column missing from a file's header.
+
+        Args:
+            validation_results (dict): Results dictionary to update in place
+            header (list): Column names from the first row of the file
+            contact_col (str): Name of contact column
+            message_col (str): Name of message column
+
+        Returns:
+            bool: True if both columns are present and the rows are worth reading
+        """
+        for col in (contact_col, message_col):
+            if col not in header:
+                validation_results['issues'].append(f"Missing required column: {col}")
+        return not validation_results['issues']
+
+    @classmethod
+    def _tally_contact_chunks(cls, validation_results: Dict, chunks: Iterable[pd.DataFrame],
+                              contact_col: str, message_col: str) -> None:
+        """
+        Count valid, empty and over-long rows of a contacts file chunk by chunk.
+
+        Counters are accumulated per chunk with vectorized pandas operations,
+        so a streamed CSV keeps memory bounded by
+        Config.PROCESSING['contacts_chunk_size']; an already loaded sheet is
+        passed as a single chunk.
+
+        Args:
+            validation_results (dict): Results dictionary to update in place
+            chunks (iterable): Frames holding the contact and message columns as text
+            contact_col (str): Name of contact column
+            message_col (str): Name of message column
+        """
+        total_rows = valid_rows = empty_contacts = empty_messages = long_messages = 0
+
+        for chunk in chunks:
+            counts = cls._count_contact_frame(chunk, contact_col, message_col)
+            total_rows += len(chunk)
+            valid_rows += counts[0]
+            empty_contacts += counts[1]
+            empty_messages += counts[2]
+            long_messages += counts[3]
+
+        validation_results['total_rows'] = total_rows
+        validation_results['valid_rows'] = valid_rows
+        cls._append_validation_warnings(validation_results, empty_contacts, empty_messages, long_messages)
+
+    @staticmethod
+    def _append_validation_warnings(validation_results: Dict, empty_contacts: int,
+                                    empty_messages: int, long_messages: int) -> None:
+        """
+        Add a warning to the validation results for each kind of problem row found.
+
+        Args:
+            validation_results (dict): Results dictionary to update in place
+            empty_contacts (int): Rows with a blank or 'nan' contact
+            empty_messages (int): Rows with a blank or 'nan' message
+            long_messages (int): Messages longer than WhatsApp's 4000 character limit
+        """
+        if empty_contacts > 0:
+            validation_results['warnings'].append(f"{empty_contacts} rows have empty contacts")
+        if empty_messages > 0:
+            validation_results['warnings'].append(f"{empty_messages} rows have empty messages")
+        if long_messages > 0:
+            validation_results['warnings'].append(f"{long_messages} messages are longer than 4000 characters")
+
+    @classmethod
+    def _count_contact_frame(cls, df: pd.DataFrame, contact_col: str, message_col: str) -> Tuple[int, int, int, int]:
+        """
+        Count valid rows, empty contacts, empty messages and over-long messages of a frame.
+
+        Cells are judged by the same rule as the send path (``_clean_text_column``:
+        blank or 'nan' is empty), and every counter is reduced from the
+        resulting arrays.
+
+        Args:
+            df (pd.DataFrame): Contacts read as text (missing cells as NaN or '')
+            contact_col (str): Name of contact column
+            message_col (str): Name of message column
+
+        Returns:
+            tuple: (valid_rows, empty_contacts, empty_messages, long_messages)
+        """
+        _, has_contact = cls._clean_text_column(df[contact_col])
+        messages, has_message = cls._clean_text_column(df[message_col])
+        message_lengths = cls._text_lengths(messages)
+
+        valid_rows = int((has_contact & has_message).sum())
+        empty_contacts = len(has_contact) - int(has_contact.sum())
+        empty_messages = len(has_message) - int(has_message.sum())
+        # Check message length (WhatsApp has limits)
+        long_messages = int((message_lengths > 4000).sum())
+        return valid_rows, empty_contacts, empty_messages, long_messages
+
+    @staticmethod
+    def _text_lengths(column: pd.Series) -> np.ndarray:
+        """
+        Character length of every cell in a text column, 0 for missing cells.
+
+        Arrow-backed strings use pandas' ``str.len`` (Arrow's ``utf8_length``
+        kernel); plain object columns are measured with ``np.fromiter``, which
+        skips the NA propagation of ``str.len`` and is about twice as fast.
+
+        Args:
+            column (pd.Series): Column read as text
+
+        Returns:
+            np.ndarray: int64 lengths aligned with ``column``
+        """
+        if column.dtype != object:
+            return column.str.len().to_numpy(dtype='int64', na_value=0)
 
-            # Validate data
-            valid_df = df.dropna(subset=[contact_col, message_col])
-            validation_results['valid_rows'] = len(valid_df)
+        import numpy as np  # Already loaded with pandas
+        return np.fromiter((len(value) if isinstance(value, str) else 0 for value in column.to_numpy()),
+                           dtype=np.int64, count=len(column))
 
-            # Check for empty values
-            empty_contacts = df[contact_col].isna().sum()
-            empty_messages = df[message_col].isna().sum()
+    @classmethod
+    def _tally_contact_rows(cls, validation_results: Dict, header: List, rows: Iterator,
+                            contact_col: str, message_col: str) -> None:
+        """
+        Count valid, empty and over-long rows of a contacts file in a single pass.
 
-            if empty_contacts > 0:
-                validation_results['warnings'].append(f"{empty_contacts} rows have empty contacts")
-            if empty_messages > 0:
-                validation_results['warnings'].append(f"{empty_messages} rows have empty messages")
+        The caller has checked that both columns are present in ``header``.
 
+        Args:
+            validation_results (dict): Results dictionary to update in place
+            header (list): Column names from the first row of the file
+            rows (iterator): Remaining rows as sequences of cell values
+            contact_col (str): Name of contact column
+            message_col (str): Name of message column
+        """
+        contact_index = header.index(contact_col)
+        message_index = header.index(message_col)
+        total_rows = valid_rows = empty_contacts = empty_messages = long_messages = 0
+
+        for row in rows:
+            total_rows += 1
+            contact = row[contact_index] if contact_index < len(row) else None
+            message = row[message_index] if message_index < len(row) else None
+
+            # Same rule as _clean_text_column: stripped text that is neither blank nor 'nan'
+            contact = '' if contact is None else str(contact).strip()
+            message = '' if message is None else str(message).strip()
+            has_contact = contact != '' and contact.lower() != 'nan'
+            has_message = message != '' and message.lower() != 'nan'
+            if not has_contact:
+                empty_contacts += 1
+            if not has_message:
+                empty_messages += 1
             # Check message length (WhatsApp has limits)
-            long_messages = (df[message_col].str.len() > 4000).sum()
-            if long_messages > 0:
-                validation_results['warnings'].append(f"{long_messages} messages are longer than 4000 characters")
+            elif len(message) > 4000:
+                long_messages += 1
+            if has_contact and has_message:
+                valid_rows += 1
 
-            validation_results['valid'] = validation_results['valid_rows'] > 0
+        validation_results['total_rows'] = total_rows
+        validation_results['valid_rows'] = valid_rows
+        cls._append_validation_warnings(validation_results, empty_contacts, empty_messages, long_messages)
 
-        except Exception as e:
-            validation_results['issues'].append(f"Error reading file: {str(e)}")
+    def clear_resume_state(self) -> None:
+        """
+        Forget which contacts interrupted runs already messaged.
 
-        return validation_results
+        The next ``send_bulk_messages`` call then messages every contact again.
+        """
+        store = SentContactsStore(os.path.join(self.user_data_dir, Config.PATHS['state_database']), '')
+        try:
+            store.clear()
+        finally:
+            store.close()
+        self.logger.info("🧹 Cleared resume state")
 
     def get_session_statistics(self) -> Dict[str, any]:
         """
@@ -916,17 +2774,25 @@ class WhatsAppAutomation:
         Returns:
             dict: Session statistics including messages sent, time elapsed, etc.
         """
-        current_time = datetime.now()
-        session_duration = (current_time - self.session_stats['session_start_time']).total_seconds()
+        stats = self.session_stats
+        sent = stats['messages_sent']
+        processed = stats['contacts_processed']
+        now = time.monotonic()
+        session_duration = now - self._session_start_mono
+
+        # Formatting the duration is the costly part; snapshots within a second reuse the text
+        if now - self._last_stats_mono >= 1.0:
+            self._last_stats_mono = now
+            self._last_stats_formatted = str(timedelta(seconds=session_duration))
 
         return {
             'session_duration_seconds': session_duration,
-            'session_duration_formatted': str(current_time - self.session_stats['session_start_time']),
-            'messages_sent': self.session_stats['messages_sent'],
-            'messages_failed': self.session_stats['messages_failed'],
-            'contacts_processed': self.session_stats['contacts_processed'],
-            'success_rate': (self.session_stats['messages_sent'] / max(1, self.session_stats['contacts_processed'])) * 100,
-            'average_time_per_message': session_duration / max(1, self.session_stats['messages_sent'])
+            'session_duration_formatted': self._last_stats_formatted,
+            'messages_sent': sent,
+            'messages_failed': stats['messages_failed'],
+            'contacts_processed': processed,
+            'success_rate': (sent / max(1, processed)) * 100,
+            'average_time_per_message': session_duration / max(1, sent)
         }
 
     def close(self) -> None:
@@ -938,16 +2804,19 @@ class WhatsAppAutomation:
         """
         try:
             # Log final session statistics
+            # One record for the whole summary, so it is written to the handlers in one go
             stats = self.get_session_statistics()
-            self.logger.info("="*50)
-            self.logger.info("SESSION STATISTICS")
-            self.logger.info("="*50)
-            self.logger.info(f"Session duration: {stats['session_duration_formatted']}")
-            self.logger.info(f"Messages sent: {stats['messages_sent']}")
-            self.logger.info(f"Messages failed: {stats['messages_failed']}")
-            self.logger.info(f"Contacts processed: {stats['contacts_processed']}")
-            self.logger.info(f"Success rate: {stats['success_rate']:.1f}%")
-            self.logger.info("="*50)
+            self.logger.info('\n'.join([
+                "="*50,
+                "SESSION STATISTICS",
+                "="*50,
+                f"Session duration: {stats['session_duration_formatted']}",
+                f"Messages sent: {stats['messages_sent']}",
+                f"Messages failed: {stats['messages_failed']}",
+                f"Contacts processed: {stats['contacts_processed']}",
+                f"Success rate: {stats['success_rate']:.1f}%",
+                "="*50
+            ]))
 
             # Close WebDriver
             if self.driver:
@@ -958,11 +2827,103 @@ class WhatsAppAutomation:
 
         except Exception as e:
             self.logger.error(f"Error during cleanup: {str(e)}")
+        finally:
+            self._release_logging()
+
+    def __enter__(self) -> 'WhatsAppAutomation':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 # ==============================================================================
 #                           UTILITY FUNCTIONS
 # ==============================================================================
 
+def _print_lines(*lines: str) -> None:
+    """
+    Print several console lines with a single write to stdout.
+
+    Args:
+        *lines (str): Lines to print, each followed by a newline
+    """
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def _css_string(value: str) -> str:
+    """
+    Quote a value for use inside a CSS attribute selector.
+
+    Args:
+        value (str): Raw attribute value (e.g. a contact name)
+
+    Returns:
+        str: Double-quoted CSS string with backslashes and quotes escaped
+    """
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+@functools.lru_cache(maxsize=1024)
+def _contact_title_selector(contact: str) -> str:
+    """
+    Build the CSS selector matching a contact's exact chat title.
+
+    Cached so the fast path and the fallback search reuse the same string
+    for a contact instead of escaping and formatting it twice.
+
+    Args:
+        contact (str): Contact name or phone number
+
+    Returns:
+        str: Selector from Config.SELECTORS['contact_title'] with the contact quoted safely
+    """
+    return Config.SELECTORS['contact_title'].format(_css_string(contact))
+
+def _csv_header(path: str) -> List[str]:
+    """
+    Read the column names of a CSV file, reusing the result while the file is unchanged.
+
+    Validation and the send path both need the header; the file's size and
+    modification time key the cache, so an edited file is parsed again.
+
+    Args:
+        path (str): Path to CSV file
+
+    Returns:
+        list: Column names from the first row of the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = os.stat(path)
+    return list(_read_csv_header(os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+@functools.lru_cache(maxsize=32)
+def _read_csv_header(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Parse a CSV header; ``mtime_ns`` and ``size`` only key the cache."""
+    return tuple(_get_pandas().read_csv(path, nrows=0).columns)
+
+@functools.lru_cache(maxsize=None)
+def _to_e164(number: str) -> Optional[str]:
+    """
+    Normalize a phone number to E.164 format using the ``phonenumbers`` library.
+
+    Results are cached, so repeated numbers in a contact list are parsed once.
+    Numbers without a '+' prefix need Config.PROCESSING['default_phone_region'].
+
+    Args:
+        number (str): Phone number as written in the contacts file
+
+    Returns:
+        Optional[str]: Number in E.164 format (e.g. '+14155552671'), or None if invalid
+    """
+    try:
+        parsed = phonenumbers.parse(number, Config.PROCESSING['default_phone_region'])
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(parsed):
+        return None
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
 def schedule_bulk_messages(contacts_file: str, 
                           send_time: str, 
                           message_column: str = 'message', 
@@ -998,7 +2959,9 @@ def schedule_bulk_messages(contacts_file: str,
         try:
             whatsapp.setup_driver()
             if whatsapp.login_to_whatsapp():
-                results = whatsapp.send_bulk_messages(contacts_file, message_column, contact_column)
+                # Each day is a new send, never a continuation of the previous day's run
+                results = whatsapp.send_bulk_messages(contacts_file, message_column, contact_column,
+                                                      resume=False)
                 print(f"\n📊 Scheduled messaging completed:")
                 print(f"   ✅ Successful: {results['successful']}")
                 print(f"   ❌ Failed: {results['failed']}")
@@ -1019,7 +2982,11 @@ def schedule_bulk_messages(contacts_file: str,
     try:
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Sleep until the next job is due, waking at least once a minute
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                break  # No jobs left to run
+            time.sleep(max(0, min(idle_seconds, 60)))
     except KeyboardInterrupt:
         print("\n⏹️ Scheduler stopped by user")
 
@@ -1027,6 +2994,9 @@ def validate_phone_numbers(phone_list: List[str]) -> Dict[str, List[str]]:
     """
     Validate a list of phone numbers using basic regex patterns.
 
+    The whole list is cleaned and matched with vectorized pandas string
+    operations instead of a Python loop with per-number regex calls.
+
     Args:
         phone_list (list): List of phone numbers to validate
 
@@ -1038,23 +3008,20 @@ def validate_phone_numbers(phone_list: List[str]) -> Dict[str, List[str]]:
         print(f"Valid: {result['valid']}")
         print(f"Invalid: {result['invalid']}")
     """
-    import re
-
-    # Regex pattern for international phone numbers
-    # Matches: +1234567890, 1234567890, +91-9876543210, etc.
-    valid_pattern = re.compile(r'^[\+]?[1-9][\d\-\s\(\)]{7,15}$')
-
-    valid_numbers = []
-    invalid_numbers = []
+    if not phone_list:
+        return {'valid': [], 'invalid': []}
 
-    for number in phone_list:
-        # Clean the number (remove extra spaces, special chars except +, -, (), spaces)
-        clean_number = re.sub(r'[^\d\+\-\(\)\s]', '', str(number).strip())
+    # Clean the numbers (remove extra spaces, special chars except +, -, (), spaces)
+    # with vectorized string operations over the whole list at once. The object
+    # Series holds the raw values (str() of each, like the per-number version);
+    # astype(str) turns it into pandas' string dtype, Arrow-backed when pyarrow
+    # is installed, where the patterns run natively
+    numbers = _get_pandas().Series(phone_list, dtype=object).astype(str).str.strip()
+    cleaned = numbers.str.replace(_PHONE_CLEAN_PATTERN, '', regex=True)
+    is_valid = cleaned.str.fullmatch(_PHONE_VALID_PATTERN).to_numpy(dtype=bool)
 
-        if clean_number and valid_pattern.match(clean_number):
-            valid_numbers.append(clean_number)
-        else:
-            invalid_numbers.append(number)
+    valid_numbers = cleaned[is_valid].tolist()
+    invalid_numbers = [phone_list[i] for i in (~is_valid).nonzero()[0]]
 
     return {
         'valid': valid_numbers,
@@ -1065,31 +3032,120 @@ def create_message_templates() -> Dict[str, str]:
     """
     Create a collection of message templates for different use cases.
 
+    The templates are built once at import time; each call returns a copy.
+
     Returns:
         dict: Dictionary of message templates
     """
-    templates = {
-        'greeting': "Hello {name}! Hope you are having a wonderful day. This is an automated message from {sender}.",
+    return dict(_MESSAGE_TEMPLATES)  # A copy callers may edit freely
+
+@functools.lru_cache(maxsize=256)
+def _template_tokens(template: str) -> Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...]:
+    """Parsed ``(literal, field, spec, conversion)`` tokens of a template."""
+    return tuple(string.Formatter().parse(template))
+
+def template_fields(template: str) -> List[str]:
+    """
+    List the placeholder names used in a message template.
 
-        'business_update': "Hi {name}, We have an exciting update about {topic}. {details} Thank you for your continued support!",
+    Args:
+        template (str): Message template with placeholders
 
-        'reminder': "Hello {name}, This is a friendly reminder about {event} scheduled for {date}. Looking forward to seeing you there!",
+    Returns:
+        list: Field names in order of first appearance, without duplicates
 
-        'promotional': "Hi {name}! 🎉 Special offer just for you: {offer}. Valid until {expiry}. Don't miss out!",
+    Example:
+        template_fields("Hi {name}, order {order_id} for {name}")  # ['name', 'order_id']
+    """
+    fields = [field for _, field, _, _ in _template_tokens(template) if field]
+    return list(dict.fromkeys(fields))
 
-        'follow_up': "Hi {name}, Following up on our previous conversation about {topic}. Please let me know if you have any questions.",
+@functools.lru_cache(maxsize=256)
+def compile_message_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Compile a message template into a fast render function.
 
-        'thank_you': "Dear {name}, Thank you so much for {reason}. Your support means a lot to us! Best regards, {sender}",
+    The template is parsed once (``_template_tokens``); the returned function
+    only performs lookups and a string join, so rendering thousands of rows
+    does not re-parse the format string for every contact. Compiled templates
+    are cached, so repeated calls with the same template reuse the renderer.
 
-        'invitation': "Hello {name}! You're invited to {event} on {date} at {location}. Hope to see you there! RSVP: {contact}"
-    }
+    Args:
+        template (str): Message template with ``str.format`` style placeholders
+
+    Returns:
+        callable: Function taking a mapping of field values and returning the message
+
+    Raises:
+        KeyError: When called with a mapping missing one of the template fields
+
+    Example:
+        render = compile_message_template("Hello {name}! Your order {order_id} is ready.")
+        message = render({'name': 'John', 'order_id': '12345'})
+    """
+    formatter = string.Formatter()
+    tokens = _template_tokens(template)
+
+    # Attribute/index lookups and nested specs are left to str.format_map
+    if any(field is not None and (not field.isidentifier() or '{' in spec)
+           for _, field, spec, _ in tokens):
+        return template.format_map
+
+    def render(values: Mapping[str, Any]) -> str:
+        parts = []
+        for literal, field, spec, conversion in tokens:
+            parts.append(literal)
+            if field is not None:
+                value = values[field]
+                if conversion:
+                    value = formatter.convert_field(value, conversion)
+                parts.append(format(value, spec))
+        return ''.join(parts)
+
+    return render
+
+def _field_variable(field: str) -> str:
+    """Top-level variable name of a placeholder field (``user.name`` and ``user[0]`` give ``user``)."""
+    return re.split(r'[.\[]', field, maxsplit=1)[0]
+
+@functools.lru_cache(maxsize=256)
+def _template_variables(template: str) -> frozenset:
+    """Top-level variable names a template needs (``{user.name}`` needs ``user``)."""
+    return frozenset(_field_variable(field) for _, field, _, _ in _template_tokens(template) if field)
+
+def _render_leaving_missing(template: str, values: Mapping[str, Any], missing: frozenset) -> str:
+    """
+    Render a template, writing placeholders of missing variables back verbatim.
 
-    return templates
+    A missing placeholder keeps its conversion and format spec (``{price:.2f}``
+    stays ``{price:.2f}``) instead of having the spec applied to placeholder text.
+
+    Args:
+        template (str): Message template with placeholders
+        values (dict): Available variable values
+        missing (frozenset): Top-level variable names without a value
+
+    Returns:
+        str: Rendered message
+    """
+    parts = []
+    for literal, field, spec, conversion in _template_tokens(template):
+        parts.append(literal)
+        if field is None:
+            continue
+        placeholder = ('{' + field + ('!' + conversion if conversion else '')
+                       + (':' + spec if spec else '') + '}')
+        parts.append(placeholder if _field_variable(field) in missing else placeholder.format_map(values))
+    return ''.join(parts)
 
 def generate_personalized_message(template: str, **kwargs) -> str:
     """
     Generate a personalized message from a template.
 
+    Placeholders without a matching keyword argument are left as-is
+    (e.g. ``{order_id}`` or ``{price:.2f}``) so one missing value does not
+    discard the message.
+
     Args:
         template (str): Message template with placeholders
         **kwargs: Keyword arguments to replace placeholders
@@ -1101,8 +3157,11 @@ def generate_personalized_message(template: str, **kwargs) -> str:
         template = "Hello {name}! Your order {order_id} is ready for pickup."
         message = generate_personalized_message(template, name="John", order_id="12345")
     """
+    variables = _template_variables(template)
     try:
-        return template.format(**kwargs)
+        if variables <= kwargs.keys():
+            return compile_message_template(template)(kwargs)
+        return _render_leaving_missing(template, kwargs, variables - kwargs.keys())
     except KeyError as e:
         return f"Error: Missing template variable {e}"
 
@@ -1125,73 +3184,105 @@ def main():
     8. Results reporting
     9. Proper cleanup
     """
-    print("\n" + "="*70)
-    print("         🚀 WHATSAPP BULK MESSAGING AUTOMATION TOOL 🚀")
-    print("="*70)
+    _print_lines(
+        "\n" + "="*70,
+        "         🚀 WHATSAPP BULK MESSAGING AUTOMATION TOOL 🚀",
+        "="*70
+    )
 
     # Tool description
-    print("\n📋 TOOL DESCRIPTION:")
-    print("   • Send bulk WhatsApp messages from CSV/Excel files")
-    print("   • Persistent login with Chrome user data directory") 
-    print("   • Smart rate limiting to prevent spam detection")
-    print("   • Comprehensive logging and error handling")
-    print("   • Progress tracking and detailed reporting")
-    print("\n⚠️  IMPORTANT: Use responsibly and comply with WhatsApp ToS")
+    _print_lines(
+        "\n📋 TOOL DESCRIPTION:",
+        "   • Send bulk WhatsApp messages from CSV/Excel files",
+        "   • Persistent login with Chrome user data directory",
+        "   • Smart rate limiting to prevent spam detection",
+        "   • Comprehensive logging and error handling",
+        "   • Progress tracking and detailed reporting",
+        "\n⚠️  IMPORTANT: Use responsibly and comply with WhatsApp ToS"
+    )
 
     # Initialize the automation tool
     try:
-        print("\n" + "="*50)
-        print("STEP 1: INITIALIZING AUTOMATION TOOL")
-        print("="*50)
+        _print_lines(
+            "\n" + "="*50,
+            "STEP 1: INITIALIZING AUTOMATION TOOL",
+            "="*50
+        )
+
+        # Use the Cloud API when credentials are configured, WhatsApp Web otherwise
+        use_cloud_api = CloudAPIBackend.is_configured()
 
         whatsapp = WhatsAppAutomation(
             user_data_dir="./whatsapp_user_data",  # Custom directory for persistent login
-            headless=False  # Set to True for headless mode (not recommended for first use)
+            headless=False,  # Set to True for headless mode (not recommended for first use)
+            backend=CloudAPIBackend.from_config() if use_cloud_api else None
         )
 
         print("✅ Automation tool initialized successfully")
 
-        # Setup WebDriver
-        print("\n" + "="*50)
-        print("STEP 2: SETTING UP CHROME WEBDRIVER")
-        print("="*50)
-        print("⏳ This may take a moment if ChromeDriver needs to be downloaded...")
+        if use_cloud_api:
+            print("\n☁️ WhatsApp Cloud API credentials found - skipping browser setup")
+            if Config.CLOUD_API['template_name']:
+                print(f"📄 Sending approved template '{Config.CLOUD_API['template_name']}' "
+                      f"({Config.CLOUD_API['template_language']}); each message fills its body parameters")
+            else:
+                _print_lines(
+                    "⚠️ No message template configured (WHATSAPP_TEMPLATE_NAME): messages are sent as",
+                    "   free-form text, which the Cloud API only delivers to contacts who messaged you",
+                    "   in the last 24 hours. Set a template for outreach to other contacts."
+                )
+        else:
+            # Setup WebDriver
+            _print_lines(
+                "\n" + "="*50,
+                "STEP 2: SETTING UP CHROME WEBDRIVER",
+                "="*50,
+                "⏳ This may take a moment if ChromeDriver needs to be downloaded..."
+            )
 
-        whatsapp.setup_driver()
-        print("✅ Chrome WebDriver setup complete")
+            whatsapp.setup_driver()
+            print("✅ Chrome WebDriver setup complete")
 
-        # Login to WhatsApp Web
-        print("\n" + "="*50)
-        print("STEP 3: CONNECTING TO WHATSAPP WEB")
-        print("="*50)
+            # Login to WhatsApp Web
+            _print_lines(
+                "\n" + "="*50,
+                "STEP 3: CONNECTING TO WHATSAPP WEB",
+                "="*50
+            )
 
-        if not whatsapp.login_to_whatsapp():
-            print("❌ Failed to login to WhatsApp Web. Exiting...")
-            return
+            if not whatsapp.login_to_whatsapp():
+                print("❌ Failed to login to WhatsApp Web. Exiting...")
+                return
 
-        print("✅ Successfully connected to WhatsApp Web")
+            print("✅ Successfully connected to WhatsApp Web")
 
         # Check for contacts file or create sample
-        print("\n" + "="*50)
-        print("STEP 4: PREPARING CONTACTS FILE")
-        print("="*50)
+        _print_lines(
+            "\n" + "="*50,
+            "STEP 4: PREPARING CONTACTS FILE",
+            "="*50
+        )
 
         contacts_filename = "contacts.csv"
 
         if not os.path.exists(contacts_filename):
-            print(f"📄 Contacts file '{contacts_filename}' not found")
-            print("🔧 Creating sample contacts file for you...")
+            _print_lines(
+                f"📄 Contacts file '{contacts_filename}' not found",
+                "🔧 Creating sample contacts file for you..."
+            )
 
             whatsapp.create_sample_contacts_file(contacts_filename)
 
-            print("\n" + "="*70)
-            print("                    ⚠️  NEXT STEPS REQUIRED")
-            print("="*70)
-            print(f"1. Edit the file '{contacts_filename}' with your actual contacts")
-            print("2. Replace sample data with real contact names/numbers and messages")
-            print("3. Save the file and run this script again")
-            print("4. Make sure recipients have consented to receive messages")
-            print("="*70)
+            _print_lines(
+                "\n" + "="*70,
+                "                    ⚠️  NEXT STEPS REQUIRED",
+                "="*70,
+                f"1. Edit the file '{contacts_filename}' with your actual contacts",
+                "2. Replace sample data with real contact names/numbers and messages",
+                "3. Save the file and run this script again",
+                "4. Make sure recipients have consented to receive messages",
+                "="*70
+            )
 
             input("\nPress Enter to exit and edit the contacts file...")
             return
@@ -1216,20 +3307,26 @@ def main():
                 print(f"   • {warning}")
 
         # Final confirmation
-        print("\n" + "="*50)
-        print("STEP 5: FINAL CONFIRMATION")
-        print("="*50)
+        _print_lines(
+            "\n" + "="*50,
+            "STEP 5: FINAL CONFIRMATION",
+            "="*50
+        )
 
-        print(f"📁 Contacts file: {contacts_filename}")
-        print(f"📊 Valid contacts: {validation['valid_rows']}")
-        print(f"⏱️ Estimated time: {validation['valid_rows'] * 6} seconds (average)")
-        print(f"🔄 Rate limiting: 3-8 seconds between messages")
+        _print_lines(
+            f"📁 Contacts file: {contacts_filename}",
+            f"📊 Valid contacts: {validation['valid_rows']}",
+            f"⏱️ Estimated time: {validation['valid_rows'] * 6} seconds (average)",
+            f"🔄 Rate limiting: 3-8 seconds between messages"
+        )
 
-        print("\n🚨 IMPORTANT REMINDERS:")
-        print("   • Only message contacts who have consented")
-        print("   • Ensure messages are relevant and valuable")
-        print("   • Monitor for any WhatsApp warnings or restrictions")
-        print("   • This tool respects WhatsApp's rate limits")
+        _print_lines(
+            "\n🚨 IMPORTANT REMINDERS:",
+            "   • Only message contacts who have consented",
+            "   • Ensure messages are relevant and valuable",
+            "   • Monitor for any WhatsApp warnings or restrictions",
+            "   • This tool respects WhatsApp's rate limits"
+        )
 
         confirm = input("\n❓ Do you want to proceed with bulk messaging? (yes/no): ").lower().strip()
 
@@ -1238,9 +3335,11 @@ def main():
             return
 
         # Execute bulk messaging
-        print("\n" + "="*50)
-        print("STEP 6: EXECUTING BULK MESSAGING")
-        print("="*50)
+        _print_lines(
+            "\n" + "="*50,
+            "STEP 6: EXECUTING BULK MESSAGING",
+            "="*50
+        )
 
         results = whatsapp.send_bulk_messages(
             contacts_file=contacts_filename,
@@ -1250,19 +3349,23 @@ def main():
         )
 
         # Display final results
-        print("\n" + "="*70)
-        print("                    🎉 OPERATION COMPLETED")
-        print("="*70)
+        _print_lines(
+            "\n" + "="*70,
+            "                    🎉 OPERATION COMPLETED",
+            "="*70
+        )
 
         success_rate = (results['successful'] / results['total'] * 100) if results['total'] > 0 else 0
 
-        print(f"📈 RESULTS SUMMARY:")
-        print(f"   📋 Total contacts: {results['total']}")
-        print(f"   ✅ Successfully sent: {results['successful']}")
-        print(f"   ❌ Failed: {results['failed']}")
-        print(f"   ⏭️ Skipped: {results['skipped']}")
-        print(f"   📊 Success rate: {success_rate:.1f}%")
-        print(f"   ⏱️ Processing time: {results['processing_time']:.1f} seconds")
+        _print_lines(
+            f"📈 RESULTS SUMMARY:",
+            f"   📋 Total contacts: {results['total']}",
+            f"   ✅ Successfully sent: {results['successful']}",
+            f"   ❌ Failed: {results['failed']}",
+            f"   ⏭️ Skipped: {results['skipped']}",
+            f"   📊 Success rate: {success_rate:.1f}%",
+            f"   ⏱️ Processing time: {results['processing_time']:.1f} seconds"
+        )
 
         if results['failed_contacts']:
             print(f"\n❌ Failed contacts:")
@@ -1273,20 +3376,28 @@ def main():
 
         # Session statistics
         stats = whatsapp.get_session_statistics()
-        print(f"\n📊 SESSION STATISTICS:")
-        print(f"   🕒 Session duration: {stats['session_duration_formatted']}")
-        print(f"   ⚡ Average time per message: {stats['average_time_per_message']:.1f} seconds")
+        _print_lines(
+            f"\n📊 SESSION STATISTICS:",
+            f"   🕒 Session duration: {stats['session_duration_formatted']}",
+            f"   ⚡ Average time per message: {stats['average_time_per_message']:.1f} seconds"
+        )
 
-        print("\n📝 Check 'whatsapp_automation.log' for detailed logs")
-        print("="*70)
+        _print_lines(
+            "\n📝 Check 'whatsapp_automation.log' for detailed logs",
+            "="*70
+        )
 
     except KeyboardInterrupt:
-        print("\n\n⚠️ Operation interrupted by user (Ctrl+C)")
-        print("🛑 Stopping automation safely...")
+        _print_lines(
+            "\n\n⚠️ Operation interrupted by user (Ctrl+C)",
+            "🛑 Stopping automation safely..."
+        )
 
     except Exception as e:
-        print(f"\n❌ Unexpected error occurred: {str(e)}")
-        print("📝 Check logs for detailed error information")
+        _print_lines(
+            f"\n❌ Unexpected error occurred: {str(e)}",
+            "📝 Check logs for detailed error information"
+        )
 
     finally:
         # Cleanup
@@ -1297,8 +3408,10 @@ def main():
         except:
             pass
 
-        print("\n👋 Thank you for using WhatsApp Bulk Messaging Automation Tool!")
-        print("🔗 Remember to use this tool responsibly and ethically")
+        _print_lines(
+            "\n👋 Thank you for using WhatsApp Bulk Messaging Automation Tool!",
+            "🔗 Remember to use this tool responsibly and ethically"
+        )
 
 # ==============================================================================
 #                           SCRIPT ENTRY POINT
@@ -1344,6 +3457,12 @@ USAGE EXAMPLES:
        headless=True
    )
 
+   WhatsApp Business Cloud API (no browser required):
+   export WHATSAPP_PHONE_NUMBER_ID=...  WHATSAPP_ACCESS_TOKEN=...
+   from whatsapp_bulk_automation import WhatsAppAutomation, CloudAPIBackend
+   whatsapp = WhatsAppAutomation(backend=CloudAPIBackend.from_config())
+   results = whatsapp.send_bulk_messages("contacts.csv")
+
 4. Scheduled Messaging:
    from whatsapp_bulk_automation import schedule_bulk_messages
    schedule_bulk_messages("contacts.csv", "09:00")